@@ -4,10 +4,17 @@
 # Proporciona APIs REST para todos los calculos del CRT y sirve la interfaz web
 #-------------------------------------------------------------------------------------
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, session
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
+import hashlib
+import orjson
+import os
+import threading
 import time
-import math
+import uuid
+import numpy as np
 
 # Importar nuestros modulos de calculos fisicos
 import crt_parameters
@@ -17,32 +24,84 @@ import lissajous_generator
 #-------------------------------------------------------------------------------------
 # CONFIGURACION DE LA APLICACION FLASK
 #-------------------------------------------------------------------------------------
+class OrjsonProvider(JSONProvider):
+    """
+    Proveedor JSON basado en orjson (implementado en Rust).
+    Serializa mucho mas rapido que el json puro de Python, lo cual importa
+    en el endpoint de tiempo real que el frontend consulta a cada frame.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # Todos los jsonify() pasan por orjson
 CORS(app)  # Permitir CORS para desarrollo
 
-# Configuracion para desarrollo
-app.config['DEBUG'] = True
+# El modo debug solo se activa explicitamente con la variable de entorno CRT_DEBUG
+# (el reloader/debugger de Werkzeug y el JSON "bonito" agregan latencia por request)
+MODO_DEBUG = bool(os.environ.get('CRT_DEBUG'))
+app.config['DEBUG'] = MODO_DEBUG
 app.config['SECRET_KEY'] = 'crt_simulator_2025'
 
+# Sin pretty-print ni orden de llaves en las respuestas JSON
+app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+app.config['JSON_SORT_KEYS'] = False
+
 #-------------------------------------------------------------------------------------
-# VARIABLES GLOBALES PARA ESTADO DE LA SIMULACION
+# ESTADO DE LA SIMULACION POR SESION
 #-------------------------------------------------------------------------------------
-# Estado actual de los voltajes (modo manual)
-estado_voltajes = {
-    'voltaje_aceleracion': crt_parameters.VOLTAJE_ACELERACION_DEFAULT,
-    'voltaje_vertical': crt_parameters.VOLTAJE_VERTICAL_DEFAULT,
-    'voltaje_horizontal': crt_parameters.VOLTAJE_HORIZONTAL_DEFAULT,
-    'tiempo_persistencia': crt_parameters.TIEMPO_PERSISTENCIA_DEFAULT
-}
+# El estado ya no vive en variables globales del modulo: cada cliente tiene su
+# propia entrada en ESTADOS_SESION, identificada por cookie de sesion o por el
+# header X-Session-Id. El candado protege el diccionario cuando el servidor
+# atiende varias peticiones en hilos; ademas elimina las escrituras cruzadas
+# entre clientes que impedian escalar a varios workers.
+ESTADOS_SESION = {}
+_candado_estados = threading.Lock()
 
-# Estado actual de Lissajous (modo automatico)
-estado_lissajous = lissajous_generator.obtener_configuracion_default_lissajous()
+def _crear_estado_default():
+    """Construye el estado inicial de una sesion nueva del simulador."""
+    return {
+        # Estado actual de los voltajes (modo manual)
+        'voltajes': {
+            'voltaje_aceleracion': crt_parameters.VOLTAJE_ACELERACION_DEFAULT,
+            'voltaje_vertical': crt_parameters.VOLTAJE_VERTICAL_DEFAULT,
+            'voltaje_horizontal': crt_parameters.VOLTAJE_HORIZONTAL_DEFAULT,
+            'tiempo_persistencia': crt_parameters.TIEMPO_PERSISTENCIA_DEFAULT
+        },
+        # Estado actual de Lissajous (modo automatico)
+        'lissajous': _asegurar_omegas(lissajous_generator.obtener_configuracion_default_lissajous()),
+        # Modo de operacion: 'manual' o 'lissajous'
+        'modo': 'manual',
+        # Tiempo de inicio para animaciones (reloj monotonico: no salta con
+        # ajustes NTP del reloj de pared, que causarian tirones en la figura)
+        'tiempo_inicio_animacion': time.monotonic()
+    }
 
-# Modo de operacion: 'manual' o 'lissajous'
-modo_operacion = 'manual'
+def obtener_estado_sesion():
+    """Devuelve el estado del simulador para la sesion actual, creandolo si no existe."""
+    id_sesion = request.headers.get('X-Session-Id')
+    if not id_sesion:
+        if 'id_sesion' not in session:
+            session['id_sesion'] = uuid.uuid4().hex
+        id_sesion = session['id_sesion']
 
-# Tiempo de inicio para animaciones
-tiempo_inicio_animacion = time.time()
+    with _candado_estados:
+        estado = ESTADOS_SESION.get(id_sesion)
+        if estado is None:
+            estado = _crear_estado_default()
+            ESTADOS_SESION[id_sesion] = estado
+        return estado
+
+def _json():
+    """
+    Lee el cuerpo JSON de la peticion directamente con orjson.
+    Evita el cache y la re-validacion de content-type de request.get_json(),
+    que para los payloads pequeños de estas APIs cuesta mas que el parseo mismo.
+    """
+    return orjson.loads(request.get_data() or b'{}')
 
 #-------------------------------------------------------------------------------------
 # RUTA PRINCIPAL - INTERFAZ WEB
@@ -55,270 +114,293 @@ def index():
 #-------------------------------------------------------------------------------------
 # APIS PARA PARAMETROS DEL SISTEMA
 #-------------------------------------------------------------------------------------
+# Los parametros del sistema y la info de Lissajous son fijos: las respuestas
+# se serializan una sola vez al arrancar junto con su ETag, y el navegador
+# puede revalidar con If-None-Match para recibir un 304 vacio
+_PARAMETROS_JSON = orjson.dumps({
+    'success': True,
+    'data': crt_parameters.obtener_parametros_sistema()
+})
+_PARAMETROS_ETAG = hashlib.md5(_PARAMETROS_JSON).hexdigest()
+
+_INFO_LISSAJOUS_JSON = orjson.dumps({
+    'success': True,
+    'data': lissajous_generator.obtener_info_lissajous()
+})
+_INFO_LISSAJOUS_ETAG = hashlib.md5(_INFO_LISSAJOUS_JSON).hexdigest()
+
+def _respuesta_estatica(cuerpo, etag):
+    """Responde un cuerpo JSON precalculado, o 304 si el cliente ya lo tiene."""
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+    respuesta = app.response_class(cuerpo, mimetype='application/json')
+    respuesta.headers['ETag'] = etag
+    return respuesta
+
 @app.route('/api/parametros-sistema', methods=['GET'])
 def obtener_parametros_sistema_api():
     """Devuelve todos los parametros fijos del sistema CRT."""
-    try:
-        parametros = crt_parameters.obtener_parametros_sistema()
-        return jsonify({
-            'success': True,
-            'data': parametros
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return _respuesta_estatica(_PARAMETROS_JSON, _PARAMETROS_ETAG)
 
 @app.route('/api/info-lissajous', methods=['GET'])
 def obtener_info_lissajous_api():
     """Devuelve informacion sobre parametros de Lissajous."""
-    try:
-        info = lissajous_generator.obtener_info_lissajous()
-        return jsonify({
-            'success': True,
-            'data': info
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return _respuesta_estatica(_INFO_LISSAJOUS_JSON, _INFO_LISSAJOUS_ETAG)
 
 #-------------------------------------------------------------------------------------
 # APIS PARA MODO MANUAL
 #-------------------------------------------------------------------------------------
+# Rangos permitidos para los campos de voltaje del modo manual
+# (comparacion encadenada min <= v <= max directa, sin llamada a funcion validadora)
+RANGOS_VOLTAJES = {
+    'voltaje_aceleracion': (crt_parameters.VOLTAJE_ACELERACION_MIN,
+                            crt_parameters.VOLTAJE_ACELERACION_MAX, 'Voltaje de aceleracion'),
+    'voltaje_vertical': (crt_parameters.VOLTAJE_VERTICAL_MIN,
+                         crt_parameters.VOLTAJE_VERTICAL_MAX, 'Voltaje vertical'),
+    'voltaje_horizontal': (crt_parameters.VOLTAJE_HORIZONTAL_MIN,
+                           crt_parameters.VOLTAJE_HORIZONTAL_MAX, 'Voltaje horizontal'),
+    'tiempo_persistencia': (crt_parameters.TIEMPO_PERSISTENCIA_MIN,
+                            crt_parameters.TIEMPO_PERSISTENCIA_MAX, 'Tiempo de persistencia')
+}
+
 @app.route('/api/actualizar-voltajes', methods=['POST'])
 def actualizar_voltajes_api():
     """Actualiza los voltajes en modo manual."""
-    global estado_voltajes, modo_operacion
-    
-    try:
-        datos = request.get_json()
-        
-        # Cambiar a modo manual
-        modo_operacion = 'manual'
-        
-        # Validar y actualizar voltaje de aceleracion
-        if 'voltaje_aceleracion' in datos:
-            voltaje = float(datos['voltaje_aceleracion'])
-            if crt_parameters.validar_voltaje_aceleracion(voltaje):
-                estado_voltajes['voltaje_aceleracion'] = voltaje
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': f'Voltaje de aceleracion fuera de rango: {voltaje}'
-                }), 400
-        
-        # Validar y actualizar voltaje vertical
-        if 'voltaje_vertical' in datos:
-            voltaje = float(datos['voltaje_vertical'])
-            if crt_parameters.validar_voltaje_vertical(voltaje):
-                estado_voltajes['voltaje_vertical'] = voltaje
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': f'Voltaje vertical fuera de rango: {voltaje}'
-                }), 400
-        
-        # Validar y actualizar voltaje horizontal
-        if 'voltaje_horizontal' in datos:
-            voltaje = float(datos['voltaje_horizontal'])
-            if crt_parameters.validar_voltaje_horizontal(voltaje):
-                estado_voltajes['voltaje_horizontal'] = voltaje
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': f'Voltaje horizontal fuera de rango: {voltaje}'
-                }), 400
-        
-        # Validar y actualizar tiempo de persistencia
-        if 'tiempo_persistencia' in datos:
-            tiempo = float(datos['tiempo_persistencia'])
-            if crt_parameters.validar_tiempo_persistencia(tiempo):
-                estado_voltajes['tiempo_persistencia'] = tiempo
-            else:
-                return jsonify({
-                    'success': False,
-                    'error': f'Tiempo de persistencia fuera de rango: {tiempo}'
-                }), 400
-        
-        return jsonify({
-            'success': True,
-            'data': estado_voltajes,
-            'modo': modo_operacion
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    datos = _json()
+    estado = obtener_estado_sesion()
+
+    # Cambiar a modo manual
+    estado['modo'] = 'manual'
+
+    # Validar y actualizar cada campo presente en la peticion
+    for campo, (minimo, maximo, descripcion) in RANGOS_VOLTAJES.items():
+        valor = datos.get(campo)
+        if valor is None:
+            continue
+        valor = float(valor)
+        if not minimo <= valor <= maximo:
+            return jsonify({
+                'success': False,
+                'error': f'{descripcion} fuera de rango: {valor}'
+            }), 400
+        estado['voltajes'][campo] = valor
+
+    return jsonify({
+        'success': True,
+        'data': estado['voltajes'],
+        'modo': estado['modo']
+    })
 
 @app.route('/api/calcular-posicion', methods=['POST'])
 def calcular_posicion_api():
     """Calcula la posicion del electron en la pantalla."""
-    try:
-        datos = request.get_json()
-        
-        # Usar voltajes proporcionados o los del estado actual
-        voltaje_aceleracion = datos.get('voltaje_aceleracion', estado_voltajes['voltaje_aceleracion'])
-        voltaje_vertical = datos.get('voltaje_vertical', estado_voltajes['voltaje_vertical'])
-        voltaje_horizontal = datos.get('voltaje_horizontal', estado_voltajes['voltaje_horizontal'])
-        
-        # Calcular posicion final
-        resultado = electron_motion.calcular_posicion_final_electron(
-            voltaje_aceleracion, voltaje_vertical, voltaje_horizontal
-        )
-        
-        return jsonify({
-            'success': True,
-            'data': resultado,
-            'voltajes_usados': {
-                'voltaje_aceleracion': voltaje_aceleracion,
-                'voltaje_vertical': voltaje_vertical,
-                'voltaje_horizontal': voltaje_horizontal
-            }
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    datos = _json()
+    estado = obtener_estado_sesion()
+
+    # Usar voltajes proporcionados o los del estado actual
+    voltaje_aceleracion = datos.get('voltaje_aceleracion', estado['voltajes']['voltaje_aceleracion'])
+    voltaje_vertical = datos.get('voltaje_vertical', estado['voltajes']['voltaje_vertical'])
+    voltaje_horizontal = datos.get('voltaje_horizontal', estado['voltajes']['voltaje_horizontal'])
+
+    # Calcular posicion final
+    resultado = electron_motion.calcular_posicion_final_electron(
+        voltaje_aceleracion, voltaje_vertical, voltaje_horizontal
+    )
+
+    return jsonify({
+        'success': True,
+        'data': resultado,
+        'voltajes_usados': {
+            'voltaje_aceleracion': voltaje_aceleracion,
+            'voltaje_vertical': voltaje_vertical,
+            'voltaje_horizontal': voltaje_horizontal
+        }
+    })
 
 #-------------------------------------------------------------------------------------
 # APIS PARA MODO LISSAJOUS
 #-------------------------------------------------------------------------------------
+# Campos que componen el estado de Lissajous (los presets traen llaves extra
+# como 'nombre' y 'ratio' que no forman parte del estado)
+LISSAJOUS_KEYS = ('frecuencia_vertical', 'fase_vertical', 'amplitud_vertical',
+                  'frecuencia_horizontal', 'fase_horizontal', 'amplitud_horizontal')
+
+# El helper canonico para cachear omega = 2*pi*f vive en lissajous_generator;
+# alias local para los handlers que actualizan la configuracion de sesion
+_asegurar_omegas = lissajous_generator.asegurar_omegas
+
 @app.route('/api/configurar-lissajous', methods=['POST'])
 def configurar_lissajous_api():
     """Configura los parametros para generar Figuras de Lissajous."""
-    global estado_lissajous, modo_operacion, tiempo_inicio_animacion
-    
-    try:
-        datos = request.get_json()
-        
-        # Cambiar a modo Lissajous
-        modo_operacion = 'lissajous'
-        
-        # Reiniciar tiempo de animacion
-        tiempo_inicio_animacion = time.time()
-        
-        # Actualizar configuracion de Lissajous
-        estado_lissajous = lissajous_generator.actualizar_parametros_lissajous(estado_lissajous, datos)
-        
-        return jsonify({
-            'success': True,
-            'data': estado_lissajous,
-            'modo': modo_operacion
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    datos = _json()
+    estado = obtener_estado_sesion()
+
+    # Cambiar a modo Lissajous
+    estado['modo'] = 'lissajous'
+
+    # Reiniciar tiempo de animacion
+    estado['tiempo_inicio_animacion'] = time.monotonic()
+
+    # Actualizar configuracion de Lissajous (recalculando las omegas); la
+    # sesion es dueña de su dict, asi que se muta en el lugar sin copiarlo
+    estado['lissajous'] = _asegurar_omegas(
+        lissajous_generator.actualizar_parametros_lissajous_inplace(estado['lissajous'], datos))
+
+    return jsonify({
+        'success': True,
+        'data': estado['lissajous'],
+        'modo': estado['modo']
+    })
 
 @app.route('/api/aplicar-preset-lissajous', methods=['POST'])
 def aplicar_preset_lissajous_api():
     """Aplica un preset predefinido de Figura de Lissajous."""
-    global estado_lissajous, modo_operacion, tiempo_inicio_animacion
-    
-    try:
-        datos = request.get_json()
-        nombre_preset = datos.get('preset')
-        
-        if not nombre_preset:
-            return jsonify({
-                'success': False,
-                'error': 'No se especifico el preset'
-            }), 400
-        
-        # Obtener presets disponibles
-        presets = lissajous_generator.obtener_presets_lissajous()
-        
-        if nombre_preset not in presets:
-            return jsonify({
-                'success': False,
-                'error': f'Preset no encontrado: {nombre_preset}'
-            }), 400
-        
-        # Cambiar a modo Lissajous
-        modo_operacion = 'lissajous'
-        
-        # Reiniciar tiempo de animacion
-        tiempo_inicio_animacion = time.time()
-        
-        # Aplicar preset
-        preset = presets[nombre_preset]
-        estado_lissajous = {
-            'frecuencia_vertical': preset['frecuencia_vertical'],
-            'fase_vertical': preset['fase_vertical'],
-            'amplitud_vertical': preset['amplitud_vertical'],
-            'frecuencia_horizontal': preset['frecuencia_horizontal'],
-            'fase_horizontal': preset['fase_horizontal'],
-            'amplitud_horizontal': preset['amplitud_horizontal']
-        }
-        
+    datos = _json()
+    estado = obtener_estado_sesion()
+    nombre_preset = datos.get('preset')
+
+    if not nombre_preset:
         return jsonify({
-            'success': True,
-            'data': estado_lissajous,
-            'preset_aplicado': preset,
-            'modo': modo_operacion
-        })
-        
-    except Exception as e:
+            'success': False,
+            'error': 'No se especifico el preset'
+        }), 400
+
+    # Obtener presets disponibles
+    presets = lissajous_generator.obtener_presets_lissajous()
+
+    if nombre_preset not in presets:
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': f'Preset no encontrado: {nombre_preset}'
+        }), 400
+
+    # Cambiar a modo Lissajous
+    estado['modo'] = 'lissajous'
+
+    # Reiniciar tiempo de animacion
+    estado['tiempo_inicio_animacion'] = time.monotonic()
+
+    # Aplicar preset
+    preset = presets[nombre_preset]
+    estado['lissajous'] = _asegurar_omegas({campo: preset[campo] for campo in LISSAJOUS_KEYS})
+
+    return jsonify({
+        'success': True,
+        'data': estado['lissajous'],
+        'preset_aplicado': preset,
+        'modo': estado['modo']
+    })
 
 @app.route('/api/voltajes-lissajous-tiempo-real', methods=['GET'])
 def obtener_voltajes_lissajous_tiempo_real():
     """Obtiene los voltajes actuales de Lissajous basados en el tiempo transcurrido."""
-    global tiempo_inicio_animacion, estado_lissajous, estado_voltajes
-    
-    try:
-        if modo_operacion != 'lissajous':
-            return jsonify({
-                'success': False,
-                'error': 'No se encuentra en modo Lissajous'
-            }), 400
-        
-        # Calcular tiempo transcurrido desde el inicio de la animacion
-        tiempo_actual = time.time() - tiempo_inicio_animacion
-        
-        # Generar voltajes para este momento
-        voltajes = lissajous_generator.generar_voltajes_lissajous(tiempo_actual, estado_lissajous)
-        
-        if 'error' in voltajes:
-            return jsonify({
-                'success': False,
-                'error': voltajes['error']
-            }), 500
-        
-        # Calcular posicion del electron con estos voltajes
-        posicion = electron_motion.calcular_posicion_final_electron(
-            estado_voltajes['voltaje_aceleracion'],
-            voltajes['voltaje_vertical'],
-            voltajes['voltaje_horizontal']
-        )
-        
+    estado = obtener_estado_sesion()
+
+    if estado['modo'] != 'lissajous':
         return jsonify({
-            'success': True,
-            'data': {
-                'voltajes': voltajes,
-                'posicion': posicion,
-                'tiempo_transcurrido': tiempo_actual,
-                'config_lissajous': estado_lissajous
-            }
-        })
-        
-    except Exception as e:
+            'success': False,
+            'error': 'No se encuentra en modo Lissajous'
+        }), 400
+
+    # Calcular tiempo transcurrido desde el inicio de la animacion
+    tiempo_actual = time.monotonic() - estado['tiempo_inicio_animacion']
+
+    # Un solo nucleo compilado genera las señales y la posicion en pantalla
+    # (la configuracion ya fue validada al escribirse en el estado)
+    config = estado['lissajous']
+    voltaje_vertical, voltaje_horizontal, posicion_x, posicion_y = electron_motion._lissajous_step(
+        tiempo_actual,
+        config['omega_vertical'], config['fase_vertical'], config['amplitud_vertical'],
+        config['omega_horizontal'], config['fase_horizontal'], config['amplitud_horizontal'],
+        estado['voltajes']['voltaje_aceleracion']
+    )
+
+    dentro_pantalla = (abs(posicion_x) <= crt_parameters.ANCHO_PANTALLA / 2 and
+                       abs(posicion_y) <= crt_parameters.ALTO_PANTALLA / 2)
+
+    # Respuesta directa con orjson para saltar la indireccion del proveedor
+    # (este endpoint se consulta a cada frame de la animacion)
+    return app.response_class(orjson.dumps({
+        'success': True,
+        'data': {
+            'voltajes': {
+                'voltaje_vertical': voltaje_vertical,
+                'voltaje_horizontal': voltaje_horizontal,
+                'tiempo': tiempo_actual
+            },
+            'posicion': {
+                'posicion_x': posicion_x,
+                'posicion_y': posicion_y,
+                'dentro_pantalla': dentro_pantalla
+            },
+            'tiempo_transcurrido': tiempo_actual,
+            'config_lissajous': config
+        }
+    }), mimetype='application/json')
+
+@app.route('/api/voltajes-lissajous-batch', methods=['GET'])
+def obtener_voltajes_lissajous_batch():
+    """
+    Devuelve un lote de N muestras de la Figura de Lissajous en una sola llamada.
+    El frontend puede pedir una ventana de tiempo completa (n muestras separadas dt)
+    en lugar de consultar el endpoint de tiempo real una vez por frame: el calculo
+    se hace vectorizado con NumPy y se reduce el numero de peticiones en factor N.
+    """
+    estado = obtener_estado_sesion()
+
+    if estado['modo'] != 'lissajous':
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': 'No se encuentra en modo Lissajous'
+        }), 400
+
+    estado_lissajous = estado['lissajous']
+
+    # Parametros del lote: numero de muestras y paso temporal
+    num_muestras = min(max(int(request.args.get('n', 512)), 1), 10000)
+    paso_tiempo = float(request.args.get('dt', 1.0 / 60.0))
+
+    # Ventana de tiempos a partir del momento actual de la animacion
+    tiempo_actual = time.monotonic() - estado['tiempo_inicio_animacion']
+    tiempos = tiempo_actual + np.arange(num_muestras) * paso_tiempo
+
+    # Señales sinusoidales vectorizadas, escaladas y recortadas in place
+    # (sin temporales: la escala y el clip escriben sobre el arreglo del sin)
+    voltajes_verticales = np.sin(
+        estado_lissajous['omega_vertical'] * tiempos +
+        estado_lissajous['fase_vertical'])
+    voltajes_verticales *= estado_lissajous['amplitud_vertical']
+    np.clip(voltajes_verticales,
+            crt_parameters.VOLTAJE_VERTICAL_MIN, crt_parameters.VOLTAJE_VERTICAL_MAX,
+            out=voltajes_verticales)
+
+    voltajes_horizontales = np.sin(
+        estado_lissajous['omega_horizontal'] * tiempos +
+        estado_lissajous['fase_horizontal'])
+    voltajes_horizontales *= estado_lissajous['amplitud_horizontal']
+    np.clip(voltajes_horizontales,
+            crt_parameters.VOLTAJE_HORIZONTAL_MIN, crt_parameters.VOLTAJE_HORIZONTAL_MAX,
+            out=voltajes_horizontales)
+
+    # Posiciones en pantalla para todo el lote en una sola pasada
+    posiciones = electron_motion.calcular_posiciones_final_electron_batch(
+        estado['voltajes']['voltaje_aceleracion'],
+        voltajes_verticales,
+        voltajes_horizontales
+    )
+
+    return jsonify({
+        'success': True,
+        'data': {
+            'tiempos': tiempos,
+            'voltajes_verticales': voltajes_verticales,
+            'voltajes_horizontales': voltajes_horizontales,
+            'posiciones_x': posiciones['posicion_x'],
+            'posiciones_y': posiciones['posicion_y'],
+            'dentro_pantalla': posiciones['dentro_pantalla'],
+            'config_lissajous': estado_lissajous
+        }
+    })
 
 #-------------------------------------------------------------------------------------
 # APIS DE CONTROL GENERAL
@@ -326,58 +408,45 @@ def obtener_voltajes_lissajous_tiempo_real():
 @app.route('/api/cambiar-modo', methods=['POST'])
 def cambiar_modo_api():
     """Cambia entre modo manual y modo Lissajous."""
-    global modo_operacion, tiempo_inicio_animacion
-    
-    try:
-        datos = request.get_json()
-        nuevo_modo = datos.get('modo')
-        
-        if nuevo_modo not in ['manual', 'lissajous']:
-            return jsonify({
-                'success': False,
-                'error': 'Modo invalido. Use "manual" o "lissajous"'
-            }), 400
-        
-        modo_operacion = nuevo_modo
-        
-        # Si cambiamos a Lissajous, reiniciar tiempo
-        if nuevo_modo == 'lissajous':
-            tiempo_inicio_animacion = time.time()
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'modo': modo_operacion,
-                'estado_voltajes': estado_voltajes,
-                'estado_lissajous': estado_lissajous
-            }
-        })
-        
-    except Exception as e:
+    datos = _json()
+    estado = obtener_estado_sesion()
+    nuevo_modo = datos.get('modo')
+
+    if nuevo_modo not in ['manual', 'lissajous']:
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': 'Modo invalido. Use "manual" o "lissajous"'
+        }), 400
+
+    estado['modo'] = nuevo_modo
+
+    # Si cambiamos a Lissajous, reiniciar tiempo
+    if nuevo_modo == 'lissajous':
+        estado['tiempo_inicio_animacion'] = time.monotonic()
+
+    return jsonify({
+        'success': True,
+        'data': {
+            'modo': estado['modo'],
+            'estado_voltajes': estado['voltajes'],
+            'estado_lissajous': estado['lissajous']
+        }
+    })
 
 @app.route('/api/estado-actual', methods=['GET'])
 def obtener_estado_actual():
     """Obtiene el estado actual completo del simulador."""
-    try:
-        return jsonify({
-            'success': True,
-            'data': {
-                'modo': modo_operacion,
-                'voltajes': estado_voltajes,
-                'lissajous': estado_lissajous,
-                'tiempo_desde_inicio': time.time() - tiempo_inicio_animacion if modo_operacion == 'lissajous' else 0
-            }
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    estado = obtener_estado_sesion()
+    return jsonify({
+        'success': True,
+        'data': {
+            'modo': estado['modo'],
+            'voltajes': estado['voltajes'],
+            'lissajous': estado['lissajous'],
+            'tiempo_desde_inicio': (time.monotonic() - estado['tiempo_inicio_animacion']
+                                    if estado['modo'] == 'lissajous' else 0)
+        }
+    })
 
 #-------------------------------------------------------------------------------------
 # MANEJO DE ERRORES
@@ -396,6 +465,20 @@ def error_interno(error):
         'error': 'Error interno del servidor'
     }), 500
 
+@app.errorhandler(Exception)
+def error_no_controlado(error):
+    """
+    Manejador unico para las excepciones de los endpoints.
+    Los handlers ya no se envuelven individualmente en try/except: cualquier
+    excepcion inesperada termina aqui con la misma respuesta JSON de antes.
+    """
+    if isinstance(error, HTTPException):
+        return error
+    return jsonify({
+        'success': False,
+        'error': str(error)
+    }), 500
+
 #-------------------------------------------------------------------------------------
 # PUNTO DE ENTRADA DE LA APLICACION
 #-------------------------------------------------------------------------------------
@@ -405,4 +488,4 @@ if __name__ == '__main__':
     print("🌐 Frontend: http://localhost:5000")
     print("📊 APIs disponibles en /api/")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5000, debug=MODO_DEBUG)
\ No newline at end of file
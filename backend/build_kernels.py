@@ -0,0 +1,42 @@
+#-------------------------------------------------------------------------------------
+# PRECOMPILACION DE LOS NUCLEOS NUMERICOS DE NUMBA
+# Ejecutar una vez al instalar/desplegar:  python build_kernels.py
+#
+# Los nucleos llevan firma explicita y cache=True, asi que se compilan al importar
+# el modulo y el resultado queda en el cache en disco de Numba (__pycache__/*.nb*).
+# Correr este script en el build paga ese costo de compilacion (que puede ser de
+# segundos) fuera del arranque del servidor: los arranques siguientes solo cargan
+# el codigo maquina ya cacheado.
+#-------------------------------------------------------------------------------------
+
+import time
+
+import numpy as np
+
+def precompilar():
+    """Importa los modulos con nucleos @njit y los ejecuta una vez para poblar el cache."""
+    inicio = time.perf_counter()
+
+    import electron_motion
+    import lissajous_generator
+
+    if not electron_motion.NUMBA_DISPONIBLE:
+        print("Numba no esta instalado: los nucleos corren en Python puro, nada que precompilar")
+        return
+
+    # Una llamada por nucleo para asegurar que el cache quede materializado
+    electron_motion._posicion_final_core(2000.0, 0.0, 0.0)
+    electron_motion._lissajous_step(0.0, 1.0, 0.0, 100.0, 1.0, 0.0, 100.0, 2000.0)
+
+    # Nucleos de lissajous_generator: _senal_nucleo y _sin_aprox ya se llaman
+    # al importar; el nucleo de secuencia se ejercita en sus dos variantes
+    for nucleo, dtype in ((lissajous_generator._llenar_secuencia_nucleo, np.float64),
+                          (lissajous_generator._llenar_secuencia_nucleo_f32, np.float32)):
+        buffers = tuple(np.empty(2, dtype=dtype) for _ in range(3))
+        nucleo(*buffers, 30.0, 1.0, 0.0, 100.0, 1.0, 0.0, 100.0)
+
+    duracion = time.perf_counter() - inicio
+    print(f"Nucleos de Numba compilados y cacheados en {duracion:.2f} s")
+
+if __name__ == '__main__':
+    precompilar()
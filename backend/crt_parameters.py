@@ -4,6 +4,7 @@
 # pero que son necesarias para los calculos del movimiento de electrones
 #-------------------------------------------------------------------------------------
 
+import functools
 import math
 
 #-------------------------------------------------------------------------------------
@@ -104,8 +105,13 @@ def validar_tiempo_persistencia(tiempo):
     """Valida que el tiempo de persistencia este dentro del rango permitido."""
     return TIEMPO_PERSISTENCIA_MIN <= tiempo <= TIEMPO_PERSISTENCIA_MAX
 
+@functools.lru_cache(maxsize=1)
 def obtener_parametros_sistema():
-    """Devuelve un diccionario con todos los parametros del sistema para el frontend."""
+    """
+    Devuelve un diccionario con todos los parametros del sistema para el frontend.
+    Como todas las constantes son fijas, el diccionario se construye una sola vez
+    y las llamadas siguientes devuelven el mismo objeto cacheado.
+    """
     return {
         'pantalla': {
             'ancho': ANCHO_PANTALLA,
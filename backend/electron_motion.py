@@ -4,28 +4,50 @@
 # desde el cañon hasta la pantalla, considerando los efectos de las placas de deflexion
 #-------------------------------------------------------------------------------------
 
+import collections
+import functools
 import math
 import numpy as np
 import crt_parameters
 
+# Numba es opcional: si esta instalado, los nucleos numericos se compilan a
+# codigo de maquina; si no, el decorador nulo deja las funciones en Python puro
+try:
+    from numba import njit
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def decorador(funcion):
+            return funcion
+        return decorador
+
 #-------------------------------------------------------------------------------------
 # FUNCIONES DE VELOCIDAD INICIAL Y ACELERACION
 #-------------------------------------------------------------------------------------
+# Combinaciones de constantes fisicas precalculadas al importar: el interprete
+# no puede plegarlas solo porque son referencias de modulo, no literales
+DOS_ABS_CARGA_SOBRE_MASA = 2 * abs(crt_parameters.CARGA_ELECTRON) / crt_parameters.MASA_ELECTRON
+
+@functools.lru_cache(maxsize=32)
 def calcular_velocidad_inicial(voltaje_aceleracion):
     """
     Calcula la velocidad inicial del electron despues de ser acelerado por el voltaje.
     Usa la ecuacion de energia cinetica: (1/2)mv^2 = eV
     Por lo tanto: v = sqrt(2eV/m)
+    Memoizada: en modo animacion el voltaje de aceleracion no cambia entre
+    frames, asi que el sqrt y la validacion se pagan una sola vez por valor.
     """
     if not crt_parameters.validar_voltaje_aceleracion(voltaje_aceleracion):
         raise ValueError(f"Voltaje de aceleracion fuera de rango: {voltaje_aceleracion}")
-    
-    # Energia cinetica ganada por el electron
-    energia_cinetica = abs(crt_parameters.CARGA_ELECTRON) * voltaje_aceleracion
-    
-    # Velocidad inicial en direccion horizontal (hacia la pantalla)
-    velocidad_inicial = math.sqrt(2 * energia_cinetica / crt_parameters.MASA_ELECTRON)
-    
+
+    # Velocidad inicial en direccion horizontal (hacia la pantalla):
+    # v = sqrt(2eV/m) con 2e/m ya precalculado
+    velocidad_inicial = math.sqrt(DOS_ABS_CARGA_SOBRE_MASA * voltaje_aceleracion)
+
     return velocidad_inicial
 
 #-------------------------------------------------------------------------------------
@@ -55,21 +77,41 @@ def calcular_campo_electrico_horizontal(voltaje_horizontal):
     campo_electrico = voltaje_horizontal / crt_parameters.SEPARACION_PLACAS_HORIZONTALES
     return campo_electrico
 
+# Relacion carga/masa del electron precalculada: evita repetir la division
+# q/m en cada llamada dentro de los bucles de animacion
+CARGA_SOBRE_MASA = crt_parameters.CARGA_ELECTRON / crt_parameters.MASA_ELECTRON
+
 def calcular_aceleracion(campo_electrico):
     """
     Calcula la aceleracion del electron en un campo electrico.
     F = qE y F = ma, por lo tanto a = qE/m
     """
-    aceleracion = (crt_parameters.CARGA_ELECTRON * campo_electrico) / crt_parameters.MASA_ELECTRON
+    aceleracion = CARGA_SOBRE_MASA * campo_electrico
     return aceleracion
 
 #-------------------------------------------------------------------------------------
 # FUNCIONES DE TRAYECTORIA DEL ELECTRON
+# Estas funciones por etapa se mantienen en Python puro a proposito: son tan
+# pequeñas que el costo de despacho de una llamada JIT superaria el de su
+# aritmetica. El camino caliente usa _posicion_final_core, que las tiene
+# inlineadas dentro de un unico nucleo compilado.
 #-------------------------------------------------------------------------------------
+# Resultados por etapa como namedtuples en vez de diccionarios: sin tabla hash
+# por llamada y con acceso por atributo a nivel de C
+ResultadoPlacasVerticales = collections.namedtuple(
+    'ResultadoPlacasVerticales', ['deflexion', 'velocidad_vertical', 'tiempo_en_placas'])
+ResultadoPlacasHorizontales = collections.namedtuple(
+    'ResultadoPlacasHorizontales', ['deflexion_horizontal', 'deflexion_vertical_adicional',
+                                    'velocidad_horizontal', 'tiempo_en_placas'])
+ResultadoVueloLibre = collections.namedtuple(
+    'ResultadoVueloLibre', ['deflexion_vertical_libre', 'deflexion_horizontal_libre',
+                            'tiempo_vuelo_libre'])
+
 def calcular_movimiento_en_placas_verticales(velocidad_inicial, voltaje_vertical):
     """
     Calcula el movimiento del electron mientras pasa por las placas de deflexion vertical.
     Movimiento uniformemente acelerado en direccion vertical.
+    Devuelve un ResultadoPlacasVerticales (acceso por atributo).
     """
     # Tiempo que el electron pasa entre las placas verticales
     tiempo_en_placas = crt_parameters.ANCHO_PLACAS_VERTICALES / velocidad_inicial
@@ -84,16 +126,17 @@ def calcular_movimiento_en_placas_verticales(velocidad_inicial, voltaje_vertical
     # Velocidad vertical al salir de las placas: v = at
     velocidad_vertical = aceleracion_vertical * tiempo_en_placas
     
-    return {
-        'deflexion': deflexion_vertical,
-        'velocidad_vertical': velocidad_vertical,
-        'tiempo_en_placas': tiempo_en_placas
-    }
+    return ResultadoPlacasVerticales(
+        deflexion=deflexion_vertical,
+        velocidad_vertical=velocidad_vertical,
+        tiempo_en_placas=tiempo_en_placas
+    )
 
 def calcular_movimiento_en_placas_horizontales(velocidad_inicial, velocidad_vertical, voltaje_horizontal):
     """
     Calcula el movimiento del electron mientras pasa por las placas de deflexion horizontal.
     El electron ya tiene velocidad vertical de las placas anteriores.
+    Devuelve un ResultadoPlacasHorizontales (acceso por atributo).
     """
     # Tiempo que el electron pasa entre las placas horizontales
     tiempo_en_placas = crt_parameters.ANCHO_PLACAS_HORIZONTALES / velocidad_inicial
@@ -105,23 +148,27 @@ def calcular_movimiento_en_placas_horizontales(velocidad_inicial, velocidad_vert
     # Deflexion horizontal adicional: x = (1/2)at^2
     deflexion_horizontal = 0.5 * aceleracion_horizontal * (tiempo_en_placas ** 2)
     
-    # Deflexion vertical adicional por movimiento previo: y = v*t + (1/2)at^2
+    # Deflexion vertical adicional por movimiento previo: y = v*t
+    # (aqui no hay termino (1/2)at^2 porque entre estas placas el campo es
+    # horizontal y la aceleracion vertical es cero; la velocidad vertical
+    # se mantiene constante)
     deflexion_vertical_adicional = velocidad_vertical * tiempo_en_placas
     
     # Velocidad horizontal al salir de las placas
     velocidad_horizontal = aceleracion_horizontal * tiempo_en_placas
     
-    return {
-        'deflexion_horizontal': deflexion_horizontal,
-        'deflexion_vertical_adicional': deflexion_vertical_adicional,
-        'velocidad_horizontal': velocidad_horizontal,
-        'tiempo_en_placas': tiempo_en_placas
-    }
+    return ResultadoPlacasHorizontales(
+        deflexion_horizontal=deflexion_horizontal,
+        deflexion_vertical_adicional=deflexion_vertical_adicional,
+        velocidad_horizontal=velocidad_horizontal,
+        tiempo_en_placas=tiempo_en_placas
+    )
 
 def calcular_movimiento_libre_hasta_pantalla(velocidad_inicial, velocidad_vertical, velocidad_horizontal):
     """
     Calcula el movimiento del electron desde las placas horizontales hasta la pantalla.
     Movimiento rectilineo uniforme (no hay mas campos electricos).
+    Devuelve un ResultadoVueloLibre (acceso por atributo).
     """
     # Tiempo de vuelo libre hasta la pantalla
     tiempo_vuelo_libre = crt_parameters.DISTANCIA_PLACAS_HORIZONTALES_A_PANTALLA / velocidad_inicial
@@ -130,57 +177,99 @@ def calcular_movimiento_libre_hasta_pantalla(velocidad_inicial, velocidad_vertic
     deflexion_vertical_libre = velocidad_vertical * tiempo_vuelo_libre
     deflexion_horizontal_libre = velocidad_horizontal * tiempo_vuelo_libre
     
-    return {
-        'deflexion_vertical_libre': deflexion_vertical_libre,
-        'deflexion_horizontal_libre': deflexion_horizontal_libre,
-        'tiempo_vuelo_libre': tiempo_vuelo_libre
-    }
+    return ResultadoVueloLibre(
+        deflexion_vertical_libre=deflexion_vertical_libre,
+        deflexion_horizontal_libre=deflexion_horizontal_libre,
+        tiempo_vuelo_libre=tiempo_vuelo_libre
+    )
 
 #-------------------------------------------------------------------------------------
 # FUNCION PRINCIPAL PARA CALCULAR POSICION FINAL
 #-------------------------------------------------------------------------------------
+# Constantes fisicas como floats a nivel de modulo para que Numba las compile
+# como literales dentro del nucleo
+_CARGA = crt_parameters.CARGA_ELECTRON
+_MASA = crt_parameters.MASA_ELECTRON
+_ANCHO_PLACAS_V = crt_parameters.ANCHO_PLACAS_VERTICALES
+_ANCHO_PLACAS_H = crt_parameters.ANCHO_PLACAS_HORIZONTALES
+_SEPARACION_V = crt_parameters.SEPARACION_PLACAS_VERTICALES
+_SEPARACION_H = crt_parameters.SEPARACION_PLACAS_HORIZONTALES
+_DIST_ENTRE_PLACAS = crt_parameters.DISTANCIA_PLACAS_VERTICALES_A_HORIZONTALES
+_DIST_A_PANTALLA = crt_parameters.DISTANCIA_PLACAS_HORIZONTALES_A_PANTALLA
+
+@njit('UniTuple(float64, 6)(float64, float64, float64)', cache=True, fastmath=True)
+def _posicion_final_core(voltaje_aceleracion, voltaje_vertical, voltaje_horizontal):
+    """
+    Nucleo numerico de los seis pasos de la trayectoria, sin diccionarios ni
+    validaciones para que Numba lo compile completo a codigo de maquina.
+    Devuelve (x, y, velocidad_inicial, velocidad_x, velocidad_y, tiempo_total).
+    """
+    # Paso 1: velocidad inicial por aceleracion
+    velocidad_inicial = math.sqrt(2 * abs(_CARGA) * voltaje_aceleracion / _MASA)
+
+    # Paso 2: placas verticales
+    tiempo_placas_v = _ANCHO_PLACAS_V / velocidad_inicial
+    aceleracion_v = _CARGA * (voltaje_vertical / _SEPARACION_V) / _MASA
+    deflexion_y_placas_v = 0.5 * aceleracion_v * tiempo_placas_v ** 2
+    velocidad_vertical = aceleracion_v * tiempo_placas_v
+
+    # Paso 3: vuelo libre entre placas
+    tiempo_entre_placas = _DIST_ENTRE_PLACAS / velocidad_inicial
+    deflexion_y_entre_placas = velocidad_vertical * tiempo_entre_placas
+
+    # Paso 4: placas horizontales
+    tiempo_placas_h = _ANCHO_PLACAS_H / velocidad_inicial
+    aceleracion_h = _CARGA * (voltaje_horizontal / _SEPARACION_H) / _MASA
+    deflexion_x_placas_h = 0.5 * aceleracion_h * tiempo_placas_h ** 2
+    deflexion_y_placas_h = velocidad_vertical * tiempo_placas_h
+    velocidad_horizontal = aceleracion_h * tiempo_placas_h
+
+    # Paso 5: vuelo libre hasta la pantalla
+    tiempo_vuelo_libre = _DIST_A_PANTALLA / velocidad_inicial
+    deflexion_x_libre = velocidad_horizontal * tiempo_vuelo_libre
+    deflexion_y_libre = velocidad_vertical * tiempo_vuelo_libre
+
+    # Paso 6: posicion final (centro de pantalla en (0, 0))
+    posicion_x = deflexion_x_placas_h + deflexion_x_libre
+    posicion_y = (deflexion_y_placas_v + deflexion_y_entre_placas +
+                  deflexion_y_placas_h + deflexion_y_libre)
+    tiempo_total = tiempo_placas_v + tiempo_entre_placas + tiempo_placas_h + tiempo_vuelo_libre
+
+    return (posicion_x, posicion_y, velocidad_inicial,
+            velocidad_horizontal, velocidad_vertical, tiempo_total)
+
+def _calcular_posicion_final_sin_validar(voltaje_aceleracion, voltaje_vertical, voltaje_horizontal):
+    """
+    Ruta directa al nucleo compilado, sin validaciones, sin try/except y sin
+    diccionario de salida: para bucles de animacion donde los voltajes ya se
+    validaron una vez. Devuelve la tupla cruda del nucleo:
+    (x, y, velocidad_inicial, velocidad_x, velocidad_y, tiempo_total).
+    """
+    return _posicion_final_core(voltaje_aceleracion, voltaje_vertical, voltaje_horizontal)
+
 def calcular_posicion_final_electron(voltaje_aceleracion, voltaje_vertical, voltaje_horizontal):
     """
     Calcula la posicion final donde el electron impacta la pantalla.
-    Esta es la funcion principal que combina todos los calculos anteriores.
+    Esta es la fachada para llamadas sueltas de la API: valida los voltajes,
+    captura errores como dict y delega la cinematica al nucleo compilado.
     """
     try:
-        # Paso 1: Calcular velocidad inicial por aceleracion
-        velocidad_inicial = calcular_velocidad_inicial(voltaje_aceleracion)
-        
-        # Paso 2: Movimiento en placas verticales
-        resultado_vertical = calcular_movimiento_en_placas_verticales(velocidad_inicial, voltaje_vertical)
-        deflexion_y_placas_verticales = resultado_vertical['deflexion']
-        velocidad_vertical = resultado_vertical['velocidad_vertical']
-        
-        # Paso 3: Movimiento entre placas verticales y horizontales (vuelo libre)
-        tiempo_entre_placas = crt_parameters.DISTANCIA_PLACAS_VERTICALES_A_HORIZONTALES / velocidad_inicial
-        deflexion_y_entre_placas = velocidad_vertical * tiempo_entre_placas
-        
-        # Paso 4: Movimiento en placas horizontales
-        resultado_horizontal = calcular_movimiento_en_placas_horizontales(
-            velocidad_inicial, velocidad_vertical, voltaje_horizontal)
-        deflexion_x_placas_horizontales = resultado_horizontal['deflexion_horizontal']
-        deflexion_y_placas_horizontales = resultado_horizontal['deflexion_vertical_adicional']
-        velocidad_horizontal = resultado_horizontal['velocidad_horizontal']
-        
-        # Paso 5: Vuelo libre hasta la pantalla
-        resultado_libre = calcular_movimiento_libre_hasta_pantalla(
-            velocidad_inicial, velocidad_vertical, velocidad_horizontal)
-        deflexion_x_libre = resultado_libre['deflexion_horizontal_libre']
-        deflexion_y_libre = resultado_libre['deflexion_vertical_libre']
-        
-        # Paso 6: Posicion final en la pantalla
-        # El centro de la pantalla es (0, 0)
-        posicion_x_final = (deflexion_x_placas_horizontales + deflexion_x_libre)
-        posicion_y_final = (deflexion_y_placas_verticales + deflexion_y_entre_placas + 
-                           deflexion_y_placas_horizontales + deflexion_y_libre)
-        
+        if not crt_parameters.validar_voltaje_aceleracion(voltaje_aceleracion):
+            raise ValueError(f"Voltaje de aceleracion fuera de rango: {voltaje_aceleracion}")
+        if not crt_parameters.validar_voltaje_vertical(voltaje_vertical):
+            raise ValueError(f"Voltaje vertical fuera de rango: {voltaje_vertical}")
+        if not crt_parameters.validar_voltaje_horizontal(voltaje_horizontal):
+            raise ValueError(f"Voltaje horizontal fuera de rango: {voltaje_horizontal}")
+
+        (posicion_x_final, posicion_y_final, velocidad_inicial,
+         velocidad_horizontal, velocidad_vertical, tiempo_total) = _calcular_posicion_final_sin_validar(
+            float(voltaje_aceleracion), float(voltaje_vertical), float(voltaje_horizontal))
+
         # Verificar si el electron impacta dentro de la pantalla
         dentro_pantalla_x = abs(posicion_x_final) <= crt_parameters.ANCHO_PANTALLA / 2
         dentro_pantalla_y = abs(posicion_y_final) <= crt_parameters.ALTO_PANTALLA / 2
         dentro_pantalla = dentro_pantalla_x and dentro_pantalla_y
-        
+
         return {
             'posicion_x': posicion_x_final,
             'posicion_y': posicion_y_final,
@@ -188,10 +277,9 @@ def calcular_posicion_final_electron(voltaje_aceleracion, voltaje_vertical, volt
             'velocidad_inicial': velocidad_inicial,
             'velocidad_final_x': velocidad_horizontal,
             'velocidad_final_y': velocidad_vertical,
-            'tiempo_total': (resultado_vertical['tiempo_en_placas'] + tiempo_entre_placas + 
-                           resultado_horizontal['tiempo_en_placas'] + resultado_libre['tiempo_vuelo_libre'])
+            'tiempo_total': tiempo_total
         }
-        
+
     except Exception as e:
         return {
             'error': str(e),
@@ -200,40 +288,161 @@ def calcular_posicion_final_electron(voltaje_aceleracion, voltaje_vertical, volt
             'dentro_pantalla': False
         }
 
+#-------------------------------------------------------------------------------------
+# NUCLEO FUSIONADO PARA EL ENDPOINT DE LISSAJOUS EN TIEMPO REAL
+#-------------------------------------------------------------------------------------
+# Limites de voltaje de las placas como literales para el nucleo compilado
+_VOLTAJE_V_MIN = float(crt_parameters.VOLTAJE_VERTICAL_MIN)
+_VOLTAJE_V_MAX = float(crt_parameters.VOLTAJE_VERTICAL_MAX)
+_VOLTAJE_H_MIN = float(crt_parameters.VOLTAJE_HORIZONTAL_MIN)
+_VOLTAJE_H_MAX = float(crt_parameters.VOLTAJE_HORIZONTAL_MAX)
+
+@njit('UniTuple(float64, 4)(float64, float64, float64, float64, float64, float64, float64, float64)',
+      cache=True, fastmath=True)
+def _lissajous_step(tiempo, omega_v, fase_v, amplitud_v,
+                    omega_h, fase_h, amplitud_h, voltaje_aceleracion):
+    """
+    Paso fusionado de la animacion Lissajous: genera los dos voltajes
+    sinusoidales y calcula la posicion en pantalla en un solo nucleo compilado,
+    sin diccionarios intermedios entre la señal y la cinematica.
+    Recibe las frecuencias angulares omega = 2*pi*f ya precalculadas.
+    Devuelve (voltaje_vertical, voltaje_horizontal, posicion_x, posicion_y).
+    """
+    # Numba compila estos max/min sobre float64 a minsd/maxsd (sin saltos),
+    # importante porque con amplitudes en el limite la señal satura seguido
+    voltaje_vertical = amplitud_v * math.sin(omega_v * tiempo + fase_v)
+    voltaje_vertical = max(_VOLTAJE_V_MIN, min(_VOLTAJE_V_MAX, voltaje_vertical))
+
+    voltaje_horizontal = amplitud_h * math.sin(omega_h * tiempo + fase_h)
+    voltaje_horizontal = max(_VOLTAJE_H_MIN, min(_VOLTAJE_H_MAX, voltaje_horizontal))
+
+    posicion_x, posicion_y, _, _, _, _ = _posicion_final_core(
+        voltaje_aceleracion, voltaje_vertical, voltaje_horizontal)
+
+    return (voltaje_vertical, voltaje_horizontal, posicion_x, posicion_y)
+
+#-------------------------------------------------------------------------------------
+# COEFICIENTES DE DEFLEXION EN FORMA CERRADA
+#-------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=32)
+def calcular_coeficientes_deflexion(voltaje_aceleracion):
+    """
+    Colapsa algebraicamente las seis etapas de la trayectoria: para un voltaje
+    de aceleracion fijo, la posicion en pantalla es lineal en los voltajes de
+    deflexion, asi que x_final = coef_x * Vh e y_final = coef_y * Vv.
+    Devuelve (coef_x, coef_y) en metros por volt. Cacheado por voltaje de
+    aceleracion porque en las animaciones solo varian Vv y Vh.
+    """
+    velocidad_inicial = calcular_velocidad_inicial(voltaje_aceleracion)
+
+    tiempo_placas_verticales = crt_parameters.ANCHO_PLACAS_VERTICALES / velocidad_inicial
+    tiempo_entre_placas = crt_parameters.DISTANCIA_PLACAS_VERTICALES_A_HORIZONTALES / velocidad_inicial
+    tiempo_placas_horizontales = crt_parameters.ANCHO_PLACAS_HORIZONTALES / velocidad_inicial
+    tiempo_vuelo_libre = crt_parameters.DISTANCIA_PLACAS_HORIZONTALES_A_PANTALLA / velocidad_inicial
+
+    # y = (1/2)a*t_v^2 + a*t_v*(t_entre + t_h + t_libre)  con  a = (q/m)*Vv/d_v
+    coef_y = (CARGA_SOBRE_MASA / crt_parameters.SEPARACION_PLACAS_VERTICALES *
+              tiempo_placas_verticales *
+              (0.5 * tiempo_placas_verticales + tiempo_entre_placas +
+               tiempo_placas_horizontales + tiempo_vuelo_libre))
+
+    # x = (1/2)a*t_h^2 + a*t_h*t_libre  con  a = (q/m)*Vh/d_h
+    coef_x = (CARGA_SOBRE_MASA / crt_parameters.SEPARACION_PLACAS_HORIZONTALES *
+              tiempo_placas_horizontales *
+              (0.5 * tiempo_placas_horizontales + tiempo_vuelo_libre))
+
+    return (coef_x, coef_y)
+
+#-------------------------------------------------------------------------------------
+# VERSION VECTORIZADA PARA LOTES DE VOLTAJES (ANIMACIONES)
+#-------------------------------------------------------------------------------------
+def calcular_posiciones_final_electron_batch(voltaje_aceleracion, voltajes_verticales,
+                                             voltajes_horizontales, out_x=None, out_y=None,
+                                             dtype=np.float64):
+    """
+    Calcula las posiciones finales en pantalla para arreglos de voltajes de deflexion.
+    Misma fisica que calcular_posicion_final_electron: como la posicion es lineal
+    en los voltajes de deflexion, todo el lote se reduce a una multiplicacion por
+    los coeficientes cerrados de calcular_coeficientes_deflexion.
+    Los parametros out_x/out_y permiten reutilizar arreglos de salida entre
+    frames y evitar una asignacion nueva por llamada. Con dtype=np.float32 las
+    posiciones ocupan la mitad de bytes rumbo al frontend; el default float64
+    conserva la precision completa para el backend.
+    """
+    voltajes_verticales = np.asarray(voltajes_verticales, dtype=dtype)
+    voltajes_horizontales = np.asarray(voltajes_horizontales, dtype=dtype)
+
+    if out_x is None:
+        out_x = np.empty_like(voltajes_horizontales)
+    if out_y is None:
+        out_y = np.empty_like(voltajes_verticales)
+
+    coef_x, coef_y = calcular_coeficientes_deflexion(voltaje_aceleracion)
+
+    # Un producto por eje (escrito sobre los arreglos de salida, sin temporales)
+    np.multiply(voltajes_horizontales, coef_x, out=out_x)
+    np.multiply(voltajes_verticales, coef_y, out=out_y)
+
+    dentro_pantalla = ((np.abs(out_x) <= crt_parameters.ANCHO_PANTALLA / 2) &
+                       (np.abs(out_y) <= crt_parameters.ALTO_PANTALLA / 2))
+
+    return {
+        'posicion_x': out_x,
+        'posicion_y': out_y,
+        'dentro_pantalla': dentro_pantalla
+    }
+
 #-------------------------------------------------------------------------------------
 # FUNCIONES PARA OBTENER TRAYECTORIA COMPLETA
 #-------------------------------------------------------------------------------------
+# Identificadores de seccion de la trayectoria (columna paralela a los puntos)
+NOMBRES_SECCIONES_TRAYECTORIA = ('canon_a_verticales', 'pantalla')
+SECCION_CANON_A_VERTICALES = 0
+SECCION_PANTALLA = 1
+
 def generar_trayectoria_completa(voltaje_aceleracion, voltaje_vertical, voltaje_horizontal, num_puntos=100):
     """
     Genera la trayectoria completa del electron con puntos intermedios para animacion.
-    Devuelve una lista de posiciones (x, y, z) a lo largo del tiempo.
+    Devuelve un diccionario con un arreglo (N, 3) de posiciones [x, y, z] y un
+    arreglo entero paralelo de secciones (indices en NOMBRES_SECCIONES_TRAYECTORIA),
+    en lugar de una lista de diccionarios por punto: un solo buffer contiguo
+    para el frontend en vez de N objetos Python.
     """
-    trayectoria = []
-    
     try:
-        velocidad_inicial = calcular_velocidad_inicial(voltaje_aceleracion)
-        
-        # Generar puntos en cada seccion del CRT
-        # Seccion 1: Desde el cañon hasta las placas verticales
-        for i in range(num_puntos // 4):
-            t = i * (crt_parameters.DISTANCIA_CANON_A_PLACAS_VERTICALES / velocidad_inicial) / (num_puntos // 4)
-            x = velocidad_inicial * t
-            y = 0
-            z = 0
-            trayectoria.append({'x': x, 'y': y, 'z': z, 'seccion': 'canon_a_verticales'})
-        
+        # Valida el voltaje de aceleracion (lanza ValueError si esta fuera de rango)
+        calcular_velocidad_inicial(voltaje_aceleracion)
+
+        # Seccion 1: desde el cañon hasta las placas verticales (movimiento
+        # rectilineo sobre el eje, y = z = 0); x crece linealmente asi que
+        # np.linspace reemplaza el bucle punto a punto
+        num_puntos_seccion = num_puntos // 4
+        puntos = np.zeros((num_puntos_seccion + 1, 3), dtype=np.float64)
+        puntos[:num_puntos_seccion, 0] = np.linspace(
+            0.0, crt_parameters.DISTANCIA_CANON_A_PLACAS_VERTICALES,
+            num_puntos_seccion, endpoint=False)
+
+        secciones = np.full(num_puntos_seccion + 1, SECCION_CANON_A_VERTICALES, dtype=np.int32)
+
         # Aqui se pueden agregar mas secciones para una animacion mas detallada
-        # Por ahora retornamos solo la posicion final para probar
-        resultado_final = calcular_posicion_final_electron(voltaje_aceleracion, voltaje_vertical, voltaje_horizontal)
-        
-        trayectoria.append({
-            'x': crt_parameters.DISTANCIA_TOTAL_CANON_A_PANTALLA,
-            'y': resultado_final['posicion_y'],
-            'z': resultado_final['posicion_x'],
-            'seccion': 'pantalla'
-        })
-        
-        return trayectoria
-        
+        # Por ahora el ultimo punto es directamente el impacto en la pantalla
+        resultado_final = calcular_posicion_final_electron(
+            voltaje_aceleracion, voltaje_vertical, voltaje_horizontal)
+
+        puntos[-1, 0] = crt_parameters.DISTANCIA_TOTAL_CANON_A_PANTALLA
+        puntos[-1, 1] = resultado_final['posicion_y']
+        puntos[-1, 2] = resultado_final['posicion_x']
+        secciones[-1] = SECCION_PANTALLA
+
+        return {'puntos': puntos, 'secciones': secciones}
+
     except Exception as e:
-        return [{'error': str(e)}]
\ No newline at end of file
+        return {'error': str(e)}
+#-------------------------------------------------------------------------------------
+# CALENTAMIENTO DE LOS NUCLEOS COMPILADOS
+#-------------------------------------------------------------------------------------
+# Una llamada de prueba al importar: con las firmas explicitas la compilacion ya
+# ocurre en el import, y esta invocacion garantiza que el binario cacheado en
+# disco se cargue aqui y no en la primera peticion del servidor.
+_posicion_final_core(float(crt_parameters.VOLTAJE_ACELERACION_DEFAULT), 0.0, 0.0)
+_lissajous_step(0.0, 2 * math.pi, 0.0, 100.0, 2 * math.pi, 0.0, 100.0,
+                float(crt_parameters.VOLTAJE_ACELERACION_DEFAULT))
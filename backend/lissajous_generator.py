@@ -4,10 +4,30 @@
 # a las placas de deflexion para crear las famosas Figuras de Lissajous
 #-------------------------------------------------------------------------------------
 
+import fractions
+import functools
 import math
+import threading
+import types
 import numpy as np
 import crt_parameters
 
+# Numba es opcional: si esta instalado, los nucleos numericos se compilan a
+# codigo de maquina; si no, el decorador nulo deja las funciones en Python puro
+try:
+    from numba import njit, prange
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def decorador(funcion):
+            return funcion
+        return decorador
+
 #-------------------------------------------------------------------------------------
 # PARAMETROS DE LAS SEÑALES SINUSOIDALES
 #-------------------------------------------------------------------------------------
@@ -16,15 +36,24 @@ FRECUENCIA_MIN = 0.1       # 0.1 Hz minimo
 FRECUENCIA_MAX = 10.0      # 10 Hz maximo
 FRECUENCIA_DEFAULT = 1.0   # 1 Hz por defecto
 
+# 2π precalculado: se usa en cada evaluacion de señal, asi que no se recalcula
+DOS_PI = 2 * math.pi
+
 # Rangos de fase para las señales sinusoidales (radianes)
 FASE_MIN = 0.0             # 0 radianes (0 grados)
-FASE_MAX = 2 * math.pi     # 2π radianes (360 grados)
+FASE_MAX = DOS_PI          # 2π radianes (360 grados)
 FASE_DEFAULT = 0.0         # Sin desfase por defecto
 
 # Amplitud de las señales (usara los rangos de voltaje definidos en parametros)
 AMPLITUD_VERTICAL_DEFAULT = 100    # 100V de amplitud para deflexion vertical
 AMPLITUD_HORIZONTAL_DEFAULT = 100  # 100V de amplitud para deflexion horizontal
 
+# Amplitud maxima por eje, precalculada al importar: los limites de voltaje de
+# crt_parameters son constantes, asi que los validadores no tienen por que
+# repetir min/abs y dos busquedas de atributo en cada arrastre del slider
+_AMP_MAX_V = min(abs(crt_parameters.VOLTAJE_VERTICAL_MIN), abs(crt_parameters.VOLTAJE_VERTICAL_MAX))
+_AMP_MAX_H = min(abs(crt_parameters.VOLTAJE_HORIZONTAL_MIN), abs(crt_parameters.VOLTAJE_HORIZONTAL_MAX))
+
 #-------------------------------------------------------------------------------------
 # FUNCIONES DE VALIDACION PARA PARAMETROS DE LISSAJOUS
 #-------------------------------------------------------------------------------------
@@ -38,11 +67,11 @@ def validar_fase(fase):
 
 def validar_amplitud_vertical(amplitud):
     """Valida que la amplitud vertical no exceda los rangos de voltaje."""
-    return amplitud <= min(abs(crt_parameters.VOLTAJE_VERTICAL_MIN), abs(crt_parameters.VOLTAJE_VERTICAL_MAX))
+    return amplitud <= _AMP_MAX_V
 
 def validar_amplitud_horizontal(amplitud):
     """Valida que la amplitud horizontal no exceda los rangos de voltaje."""
-    return amplitud <= min(abs(crt_parameters.VOLTAJE_HORIZONTAL_MIN), abs(crt_parameters.VOLTAJE_HORIZONTAL_MAX))
+    return amplitud <= _AMP_MAX_H
 
 #-------------------------------------------------------------------------------------
 # FUNCIONES GENERADORAS DE SEÑALES SINUSOIDALES CORREGIDAS
@@ -56,23 +85,50 @@ def generar_senal_vertical(tiempo, frecuencia_vertical, fase_vertical, amplitud_
     """
     if not validar_frecuencia(frecuencia_vertical):
         raise ValueError(f"Frecuencia vertical fuera de rango: {frecuencia_vertical}")
-    
+
     if not validar_amplitud_vertical(amplitud_vertical):
         raise ValueError(f"Amplitud vertical fuera de rango: {amplitud_vertical}")
-    
-    # IMPORTANTE: tiempo debe empezar desde 0 para figuras correctas
-    # Calcular voltaje sinusoidal - fase ya en radianes
-    voltaje_vertical = amplitud_vertical * math.sin(
-        2 * math.pi * frecuencia_vertical * tiempo + fase_vertical
-    )
-    
-    # Asegurar que este dentro de los limites de voltaje
-    voltaje_vertical = max(
-        crt_parameters.VOLTAJE_VERTICAL_MIN, 
-        min(crt_parameters.VOLTAJE_VERTICAL_MAX, voltaje_vertical)
+
+    return _generar_senal_vertical_sin_validar(
+        tiempo, frecuencia_vertical, fase_vertical, amplitud_vertical
     )
-    
-    return voltaje_vertical
+
+# Limites de voltaje como floats a nivel de modulo para el nucleo compilado
+_VOLTAJE_V_MIN = float(crt_parameters.VOLTAJE_VERTICAL_MIN)
+_VOLTAJE_V_MAX = float(crt_parameters.VOLTAJE_VERTICAL_MAX)
+_VOLTAJE_H_MIN = float(crt_parameters.VOLTAJE_HORIZONTAL_MIN)
+_VOLTAJE_H_MAX = float(crt_parameters.VOLTAJE_HORIZONTAL_MAX)
+
+@njit('float64(float64, float64, float64, float64, float64, float64)',
+      cache=True, fastmath=True)
+def _senal_nucleo(tiempo, omega, fase, amplitud, voltaje_min, voltaje_max):
+    """
+    Nucleo escalar de una señal sinusoidal recortada, compilado por Numba:
+    multiplicacion-suma, sin y recorte sin pasar por el interprete.
+    Recibe la frecuencia angular omega = 2*pi*f ya precalculada.
+    IMPORTANTE: tiempo debe empezar desde 0 para figuras correctas; la fase
+    ya viene en radianes.
+    """
+    voltaje = amplitud * math.sin(omega * tiempo + fase)
+    return max(voltaje_min, min(voltaje_max, voltaje))
+
+def asegurar_omegas(config_lissajous):
+    """
+    Cachea en la configuracion las frecuencias angulares omega = 2*pi*f.
+    Llamarla cada vez que cambia una frecuencia: el camino caliente por frame
+    evalua sin(omega*t + fase) sin volver a multiplicar por 2*pi.
+    """
+    config_lissajous['omega_vertical'] = DOS_PI * config_lissajous['frecuencia_vertical']
+    config_lissajous['omega_horizontal'] = DOS_PI * config_lissajous['frecuencia_horizontal']
+    return config_lissajous
+
+def _generar_senal_vertical_sin_validar(tiempo, frecuencia_vertical, fase_vertical, amplitud_vertical):
+    """
+    Variante sin validaciones de generar_senal_vertical, para bucles donde la
+    configuracion ya fue validada una sola vez fuera del bucle.
+    """
+    return _senal_nucleo(tiempo, DOS_PI * frecuencia_vertical, fase_vertical, amplitud_vertical,
+                         _VOLTAJE_V_MIN, _VOLTAJE_V_MAX)
 
 def generar_senal_horizontal(tiempo, frecuencia_horizontal, fase_horizontal, amplitud_horizontal):
     """
@@ -83,196 +139,242 @@ def generar_senal_horizontal(tiempo, frecuencia_horizontal, fase_horizontal, amp
     """
     if not validar_frecuencia(frecuencia_horizontal):
         raise ValueError(f"Frecuencia horizontal fuera de rango: {frecuencia_horizontal}")
-        
+
     if not validar_amplitud_horizontal(amplitud_horizontal):
         raise ValueError(f"Amplitud horizontal fuera de rango: {amplitud_horizontal}")
-    
-    # IMPORTANTE: tiempo debe empezar desde 0 para figuras correctas
-    # Calcular voltaje sinusoidal - fase ya en radianes
-    voltaje_horizontal = amplitud_horizontal * math.sin(
-        2 * math.pi * frecuencia_horizontal * tiempo + fase_horizontal
-    )
-    
-    # Asegurar que este dentro de los limites de voltaje
-    voltaje_horizontal = max(
-        crt_parameters.VOLTAJE_HORIZONTAL_MIN, 
-        min(crt_parameters.VOLTAJE_HORIZONTAL_MAX, voltaje_horizontal)
+
+    return _generar_senal_horizontal_sin_validar(
+        tiempo, frecuencia_horizontal, fase_horizontal, amplitud_horizontal
     )
-    
-    return voltaje_horizontal
+
+def _generar_senal_horizontal_sin_validar(tiempo, frecuencia_horizontal, fase_horizontal, amplitud_horizontal):
+    """
+    Variante sin validaciones de generar_senal_horizontal, para bucles donde la
+    configuracion ya fue validada una sola vez fuera del bucle.
+    """
+    return _senal_nucleo(tiempo, DOS_PI * frecuencia_horizontal, fase_horizontal, amplitud_horizontal,
+                         _VOLTAJE_H_MIN, _VOLTAJE_H_MAX)
 
 #-------------------------------------------------------------------------------------
 # PRESETS CORREGIDOS DE FIGURAS DE LISSAJOUS SEGÚN EL DOCUMENTO
 #-------------------------------------------------------------------------------------
+# Los presets son estaticos: el diccionario se construye una sola vez al
+# importar el modulo (incluida la aritmetica con math.pi) y todas las llamadas
+# comparten la misma referencia. El MappingProxyType lo vuelve de solo lectura
+# para que ningun consumidor agregue o quite presets por accidente (ojo: para
+# serializar con orjson hay que convertirlo antes con dict())
+_PRESETS_LISSAJOUS = types.MappingProxyType({
+    'linea_diagonal': {
+        'nombre': 'Línea Diagonal',
+        'descripcion': 'Frecuencias iguales, sin desfase - δ=0',
+        'frecuencia_vertical': 1.0,
+        'fase_vertical': 0.0,                    # 0 grados
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 1.0,
+        'fase_horizontal': 0.0,                  # 0 grados = línea diagonal
+        'amplitud_horizontal': 150,
+        'ratio': '1:1'
+    },
+    'elipse': {
+        'nombre': 'Elipse',
+        'descripcion': 'Frecuencias iguales, fase de π/4 - δ=π/4',
+        'frecuencia_vertical': 1.0,
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 1.0,
+        'fase_horizontal': math.pi / 4,          # π/4 = 45 grados
+        'amplitud_horizontal': 150,
+        'ratio': '1:1'
+    },
+    'circulo': {
+        'nombre': 'Círculo',
+        'descripcion': 'Frecuencias iguales, fase de π/2 - δ=π/2',
+        'frecuencia_vertical': 1.0,
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,                # Amplitudes iguales para círculo perfecto
+        'frecuencia_horizontal': 1.0,
+        'fase_horizontal': math.pi / 2,          # π/2 = 90 grados para círculo
+        'amplitud_horizontal': 150,
+        'ratio': '1:1'
+    },
+    'elipse_3pi4': {
+        'nombre': 'Elipse 3π/4',
+        'descripcion': 'Frecuencias iguales, fase de 3π/4 - δ=3π/4',
+        'frecuencia_vertical': 1.0,
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 1.0,
+        'fase_horizontal': 3 * math.pi / 4,      # 3π/4 = 135 grados
+        'amplitud_horizontal': 150,
+        'ratio': '1:1'
+    },
+    'linea_horizontal': {
+        'nombre': 'Línea Horizontal',
+        'descripcion': 'Frecuencias iguales, fase de π - δ=π',
+        'frecuencia_vertical': 1.0,
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 1.0,
+        'fase_horizontal': math.pi,              # π = 180 grados
+        'amplitud_horizontal': 150,
+        'ratio': '1:1'
+    },
+    'ocho_vertical': {
+        'nombre': 'Ocho Vertical (1:2)',
+        'descripcion': 'Relación 1:2 vertical - δ=0',
+        'frecuencia_vertical': 1.0,              # Base
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 2.0,            # Doble frecuencia
+        'fase_horizontal': 0.0,                  # Sin desfase
+        'amplitud_horizontal': 150,
+        'ratio': '1:2'
+    },
+    'ocho': {
+        'nombre': 'Ocho Horizontal (2:1)', 
+        'descripcion': 'Relación 2:1 horizontal - δ=0',
+        'frecuencia_vertical': 2.0,              # Doble frecuencia
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 1.0,            # Base
+        'fase_horizontal': 0.0,                  # Sin desfase
+        'amplitud_horizontal': 150,
+        'ratio': '2:1'
+    },
+    'trebol_3_1': {
+        'nombre': 'Trébol (3:1)',
+        'descripcion': 'Relación 3:1 - δ=0',
+        'frecuencia_vertical': 3.0,              # Triple frecuencia
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 1.0,            # Base
+        'fase_horizontal': 0.0,                  # Sin desfase
+        'amplitud_horizontal': 150,
+        'ratio': '3:1'
+    },
+    'trebol': {
+        'nombre': 'Trébol (1:3)',
+        'descripcion': 'Relación 1:3 - δ=0',
+        'frecuencia_vertical': 1.0,              # Base
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 3.0,            # Triple frecuencia
+        'fase_horizontal': 0.0,                  # Sin desfase
+        'amplitud_horizontal': 150,
+        'ratio': '1:3'
+    },
+    'mariposa': {
+        'nombre': 'Mariposa (3:2)',
+        'descripcion': 'Relación 3:2 con desfase π/2',
+        'frecuencia_vertical': 3.0,
+        'fase_vertical': 0.0,
+        'amplitud_vertical': 150,
+        'frecuencia_horizontal': 2.0,
+        'fase_horizontal': math.pi / 2,          # π/2 para patrón complejo
+        'amplitud_horizontal': 150,
+        'ratio': '3:2'
+    }
+})
+
 def obtener_presets_lissajous():
     """
     Devuelve configuraciones predefinidas para generar Figuras de Lissajous clasicas.
     CORREGIDO según el documento del proyecto y las fórmulas estándar.
     """
-    presets = {
-        'linea_diagonal': {
-            'nombre': 'Línea Diagonal',
-            'descripcion': 'Frecuencias iguales, sin desfase - δ=0',
-            'frecuencia_vertical': 1.0,
-            'fase_vertical': 0.0,                    # 0 grados
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 1.0,
-            'fase_horizontal': 0.0,                  # 0 grados = línea diagonal
-            'amplitud_horizontal': 150,
-            'ratio': '1:1'
-        },
-        'elipse': {
-            'nombre': 'Elipse',
-            'descripcion': 'Frecuencias iguales, fase de π/4 - δ=π/4',
-            'frecuencia_vertical': 1.0,
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 1.0,
-            'fase_horizontal': math.pi / 4,          # π/4 = 45 grados
-            'amplitud_horizontal': 150,
-            'ratio': '1:1'
-        },
-        'circulo': {
-            'nombre': 'Círculo',
-            'descripcion': 'Frecuencias iguales, fase de π/2 - δ=π/2',
-            'frecuencia_vertical': 1.0,
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,                # Amplitudes iguales para círculo perfecto
-            'frecuencia_horizontal': 1.0,
-            'fase_horizontal': math.pi / 2,          # π/2 = 90 grados para círculo
-            'amplitud_horizontal': 150,
-            'ratio': '1:1'
-        },
-        'elipse_3pi4': {
-            'nombre': 'Elipse 3π/4',
-            'descripcion': 'Frecuencias iguales, fase de 3π/4 - δ=3π/4',
-            'frecuencia_vertical': 1.0,
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 1.0,
-            'fase_horizontal': 3 * math.pi / 4,      # 3π/4 = 135 grados
-            'amplitud_horizontal': 150,
-            'ratio': '1:1'
-        },
-        'linea_horizontal': {
-            'nombre': 'Línea Horizontal',
-            'descripcion': 'Frecuencias iguales, fase de π - δ=π',
-            'frecuencia_vertical': 1.0,
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 1.0,
-            'fase_horizontal': math.pi,              # π = 180 grados
-            'amplitud_horizontal': 150,
-            'ratio': '1:1'
-        },
-        'ocho_vertical': {
-            'nombre': 'Ocho Vertical (1:2)',
-            'descripcion': 'Relación 1:2 vertical - δ=0',
-            'frecuencia_vertical': 1.0,              # Base
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 2.0,            # Doble frecuencia
-            'fase_horizontal': 0.0,                  # Sin desfase
-            'amplitud_horizontal': 150,
-            'ratio': '1:2'
-        },
-        'ocho': {
-            'nombre': 'Ocho Horizontal (2:1)', 
-            'descripcion': 'Relación 2:1 horizontal - δ=0',
-            'frecuencia_vertical': 2.0,              # Doble frecuencia
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 1.0,            # Base
-            'fase_horizontal': 0.0,                  # Sin desfase
-            'amplitud_horizontal': 150,
-            'ratio': '2:1'
-        },
-        'trebol_3_1': {
-            'nombre': 'Trébol (3:1)',
-            'descripcion': 'Relación 3:1 - δ=0',
-            'frecuencia_vertical': 3.0,              # Triple frecuencia
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 1.0,            # Base
-            'fase_horizontal': 0.0,                  # Sin desfase
-            'amplitud_horizontal': 150,
-            'ratio': '3:1'
-        },
-        'trebol': {
-            'nombre': 'Trébol (1:3)',
-            'descripcion': 'Relación 1:3 - δ=0',
-            'frecuencia_vertical': 1.0,              # Base
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 3.0,            # Triple frecuencia
-            'fase_horizontal': 0.0,                  # Sin desfase
-            'amplitud_horizontal': 150,
-            'ratio': '1:3'
-        },
-        'mariposa': {
-            'nombre': 'Mariposa (3:2)',
-            'descripcion': 'Relación 3:2 con desfase π/2',
-            'frecuencia_vertical': 3.0,
-            'fase_vertical': 0.0,
-            'amplitud_vertical': 150,
-            'frecuencia_horizontal': 2.0,
-            'fase_horizontal': math.pi / 2,          # π/2 para patrón complejo
-            'amplitud_horizontal': 150,
-            'ratio': '3:2'
-        }
-    }
-    
-    return presets
+    return _PRESETS_LISSAJOUS
 
 #-------------------------------------------------------------------------------------
 # FUNCIÓN CORREGIDA PARA GENERAR VOLTAJES LISSAJOUS
 #-------------------------------------------------------------------------------------
-def generar_voltajes_lissajous(tiempo, config_lissajous):
+# Activa el diagnostico de generar_voltajes_lissajous para todas las llamadas
+# (tambien se puede pedir por llamada con debug=True)
+DEBUG_LISSAJOUS = False
+
+def _generar_voltajes_impl(tiempo, config_lissajous, debug=False):
     """
-    Genera ambos voltajes simultaneamente para crear una Figura de Lissajous.
-    
-    CORREGIDO: 
-    - Manejo correcto de fases
-    - Tiempo normalizado desde 0
-    - Validaciones mejoradas
+    Camino caliente de los voltajes por frame: sin try/except y sin validar.
+    El llamador debe haber pasado la configuracion por
+    _validar_configuracion_lissajous (una vez por secuencia, no por frame).
+    Mantener el cuerpo libre de manejo de excepciones: el armado del frame
+    de excepcion cuesta aunque nunca se lance nada.
     """
-    try:
-        # Validar configuración
-        required_keys = ['frecuencia_vertical', 'fase_vertical', 'amplitud_vertical',
-                        'frecuencia_horizontal', 'fase_horizontal', 'amplitud_horizontal']
-        
-        for key in required_keys:
-            if key not in config_lissajous:
-                raise ValueError(f"Falta parámetro en configuración: {key}")
-        
-        # IMPORTANTE: Asegurar que el tiempo sea >= 0
-        tiempo_normalizado = max(0, tiempo)
-        
-        voltaje_vertical = generar_senal_vertical(
-            tiempo_normalizado,
-            config_lissajous['frecuencia_vertical'],
+    # IMPORTANTE: Asegurar que el tiempo sea >= 0
+    tiempo_normalizado = max(0, tiempo)
+
+    # Usar las frecuencias angulares cacheadas si el llamador las mantiene
+    # con asegurar_omegas; si no, calcularlas sin tocar el dict recibido
+    # (los presets compartidos no deben mutarse)
+    omega_vertical = config_lissajous.get('omega_vertical')
+    if omega_vertical is None:
+        omega_vertical = DOS_PI * config_lissajous['frecuencia_vertical']
+    omega_horizontal = config_lissajous.get('omega_horizontal')
+    if omega_horizontal is None:
+        omega_horizontal = DOS_PI * config_lissajous['frecuencia_horizontal']
+
+    if NUMBA_DISPONIBLE:
+        voltaje_vertical = _senal_nucleo(
+            tiempo_normalizado, omega_vertical,
             config_lissajous['fase_vertical'],      # Ya debe estar en radianes
-            config_lissajous['amplitud_vertical']
+            config_lissajous['amplitud_vertical'],
+            _VOLTAJE_V_MIN, _VOLTAJE_V_MAX
         )
-        
-        voltaje_horizontal = generar_senal_horizontal(
-            tiempo_normalizado,
-            config_lissajous['frecuencia_horizontal'],
+
+        voltaje_horizontal = _senal_nucleo(
+            tiempo_normalizado, omega_horizontal,
             config_lissajous['fase_horizontal'],    # Ya debe estar en radianes
-            config_lissajous['amplitud_horizontal']
+            config_lissajous['amplitud_horizontal'],
+            _VOLTAJE_H_MIN, _VOLTAJE_H_MAX
         )
-        
-        return {
-            'voltaje_vertical': voltaje_vertical,
-            'voltaje_horizontal': voltaje_horizontal,
-            'tiempo': tiempo_normalizado,
-            'debug_info': {
-                'config_usado': config_lissajous,
-                'tiempo_original': tiempo,
-                'tiempo_normalizado': tiempo_normalizado
-            }
+    else:
+        # Sin Numba las dos señales se funden en un solo np.sin de ancho 2
+        # (NumPy despacha al sin vectorizado de libm cuando esta disponible),
+        # en vez de dos recorridos escalares por el interprete
+        senos = np.sin(np.array([
+            omega_vertical * tiempo_normalizado + config_lissajous['fase_vertical'],
+            omega_horizontal * tiempo_normalizado + config_lissajous['fase_horizontal']
+        ]))
+        # float() devuelve escalares nativos, igual que el camino compilado
+        voltaje_vertical = max(_VOLTAJE_V_MIN, min(
+            _VOLTAJE_V_MAX, config_lissajous['amplitud_vertical'] * float(senos[0])))
+        voltaje_horizontal = max(_VOLTAJE_H_MIN, min(
+            _VOLTAJE_H_MAX, config_lissajous['amplitud_horizontal'] * float(senos[1])))
+
+    resultado = {
+        'voltaje_vertical': voltaje_vertical,
+        'voltaje_horizontal': voltaje_horizontal,
+        'tiempo': tiempo_normalizado
+    }
+
+    if debug or DEBUG_LISSAJOUS:
+        resultado['debug_info'] = {
+            'config_usado': config_lissajous,
+            'tiempo_original': tiempo,
+            'tiempo_normalizado': tiempo_normalizado
         }
-        
+
+    return resultado
+
+def generar_voltajes_lissajous(tiempo, config_lissajous, debug=False):
+    """
+    Genera ambos voltajes simultaneamente para crear una Figura de Lissajous.
+
+    CORREGIDO:
+    - Manejo correcto de fases
+    - Tiempo normalizado desde 0
+    - Validaciones mejoradas
+
+    Envoltura segura sobre _generar_voltajes_impl: valida la configuracion y
+    traduce cualquier excepcion al diccionario de error del API. Quien genere
+    secuencias completas puede validar una sola vez y llamar directo al impl.
+
+    El bloque debug_info (con referencia a la config usada) solo se arma con
+    debug=True o DEBUG_LISSAJOUS: en secuencias largas esos N diccionarios
+    extra y sus referencias a la config retenian memoria sin aportar nada.
+    """
+    try:
+        # Validar configuración (presencia de claves y rangos, una sola vez)
+        _validar_configuracion_lissajous(config_lissajous)
+        return _generar_voltajes_impl(tiempo, config_lissajous, debug)
     except Exception as e:
         return {
             'error': str(e),
@@ -284,104 +386,479 @@ def generar_voltajes_lissajous(tiempo, config_lissajous):
 #-------------------------------------------------------------------------------------
 # FUNCIONES PARA ANIMACION TEMPORAL DE LISSAJOUS
 #-------------------------------------------------------------------------------------
+# Claves obligatorias de una configuracion de Lissajous: frozenset de modulo
+# para verificar la presencia de todas con una sola diferencia de conjuntos en
+# vez de seis busquedas individuales por llamada
+_REQUIRED_LISSAJOUS_KEYS = frozenset((
+    'frecuencia_vertical', 'fase_vertical', 'amplitud_vertical',
+    'frecuencia_horizontal', 'fase_horizontal', 'amplitud_horizontal'
+))
+
+def _validar_configuracion_lissajous(config_lissajous):
+    """
+    Valida una configuracion completa de Lissajous de una sola vez.
+    Lanza ValueError si falta un parametro o alguno esta fuera de rango.
+    """
+    faltantes = _REQUIRED_LISSAJOUS_KEYS - config_lissajous.keys()
+    if faltantes:
+        raise ValueError(f"Falta parámetro en configuración: {next(iter(faltantes))}")
+
+    if not validar_frecuencia(config_lissajous['frecuencia_vertical']):
+        raise ValueError(f"Frecuencia vertical fuera de rango: {config_lissajous['frecuencia_vertical']}")
+    if not validar_frecuencia(config_lissajous['frecuencia_horizontal']):
+        raise ValueError(f"Frecuencia horizontal fuera de rango: {config_lissajous['frecuencia_horizontal']}")
+    if not validar_amplitud_vertical(config_lissajous['amplitud_vertical']):
+        raise ValueError(f"Amplitud vertical fuera de rango: {config_lissajous['amplitud_vertical']}")
+    if not validar_amplitud_horizontal(config_lissajous['amplitud_horizontal']):
+        raise ValueError(f"Amplitud horizontal fuera de rango: {config_lissajous['amplitud_horizontal']}")
+
+# Buffers por hilo para la ruta vectorizada: evitan asignar arreglos nuevos en
+# cada llamada cuando el numero de frames no cambia (el caso tipico: la misma
+# animacion se regenera al tocar un parametro)
+_buffers_hilo = threading.local()
+
+def _obtener_buffers_secuencia(num_frames, dtype):
+    """
+    Devuelve los buffers reutilizables de este hilo para num_frames frames del
+    dtype pedido, creandolos (o redimensionandolos) solo cuando cambian.
+    'indices' guarda 0..N-1 ya convertido al dtype para derivar los tiempos
+    sin pasar por np.arange en cada llamada.
+    """
+    buffers = getattr(_buffers_hilo, 'secuencia', None)
+    if (buffers is None or buffers['indices'].shape[0] != num_frames or
+            buffers['indices'].dtype != dtype):
+        buffers = {
+            'indices': np.arange(num_frames, dtype=dtype),
+            'tiempo': np.empty(num_frames, dtype=dtype),
+            'fase': np.empty(num_frames, dtype=dtype),
+            'voltaje_vertical': np.empty(num_frames, dtype=dtype),
+            'voltaje_horizontal': np.empty(num_frames, dtype=dtype)
+        }
+        _buffers_hilo.secuencia = buffers
+    return buffers
+
+# Constantes de reduccion de argumento para la aproximacion polinomial del seno
+_DOS_SOBRE_PI = 2.0 / math.pi
+_PI_SOBRE_DOS = math.pi / 2.0
+
+@njit('float64(float64)', cache=True, fastmath=True)
+def _sin_aprox(x):
+    """
+    Seno aproximado con reduccion por cuadrante y polinomios de Horner sobre
+    el argumento reducido a [-pi/4, pi/4]: error maximo ~3e-7, sobra para
+    voltajes que terminan en pixeles de pantalla, y varias veces mas barato
+    que el sin de libm dentro del nucleo vectorial.
+    """
+    cuadrante = int(math.floor(x * _DOS_SOBRE_PI + 0.5))
+    r = x - cuadrante * _PI_SOBRE_DOS
+    r2 = r * r
+    seleccion = cuadrante & 3
+    if seleccion == 0:
+        return r * (1.0 + r2 * (-1.0 / 6.0 + r2 * (1.0 / 120.0 - r2 / 5040.0)))
+    if seleccion == 1:
+        return 1.0 + r2 * (-0.5 + r2 * (1.0 / 24.0 + r2 * (-1.0 / 720.0 + r2 / 40320.0)))
+    if seleccion == 2:
+        return -r * (1.0 + r2 * (-1.0 / 6.0 + r2 * (1.0 / 120.0 - r2 / 5040.0)))
+    return -(1.0 + r2 * (-0.5 + r2 * (1.0 / 24.0 + r2 * (-1.0 / 720.0 + r2 / 40320.0))))
+
+@njit('void(float64[:], float64[:], float64[:], float64, float64, float64, float64, '
+      'float64, float64, float64)', parallel=True, fastmath=True, cache=True)
+def _llenar_secuencia_nucleo(tiempos, voltajes_verticales, voltajes_horizontales, fps,
+                             frecuencia_vertical, fase_vertical, amplitud_vertical,
+                             frecuencia_horizontal, fase_horizontal, amplitud_horizontal):
+    """
+    Nucleo fusionado de la secuencia: tiempo, dos sin, escala y recorte de cada
+    frame en una sola pasada sobre los buffers, repartida entre nucleos con
+    prange. Evita las tres pasadas separadas (sin, multiplicacion, clip) de la
+    version NumPy cuando el buffer no cabe en cache. Usa el sin completo de
+    libm: quien pide float64 pide toda la precision.
+    """
+    omega_vertical = DOS_PI * frecuencia_vertical
+    omega_horizontal = DOS_PI * frecuencia_horizontal
+    for i in prange(tiempos.shape[0]):
+        t = i / fps
+        tiempos[i] = t
+        senal_vertical = amplitud_vertical * math.sin(omega_vertical * t + fase_vertical)
+        senal_horizontal = amplitud_horizontal * math.sin(omega_horizontal * t + fase_horizontal)
+        voltajes_verticales[i] = max(_VOLTAJE_V_MIN, min(_VOLTAJE_V_MAX, senal_vertical))
+        voltajes_horizontales[i] = max(_VOLTAJE_H_MIN, min(_VOLTAJE_H_MAX, senal_horizontal))
+
+@njit('void(float32[:], float32[:], float32[:], float64, float64, float64, float64, '
+      'float64, float64, float64)', parallel=True, fastmath=True, cache=True)
+def _llenar_secuencia_nucleo_f32(tiempos, voltajes_verticales, voltajes_horizontales, fps,
+                                 frecuencia_vertical, fase_vertical, amplitud_vertical,
+                                 frecuencia_horizontal, fase_horizontal, amplitud_horizontal):
+    """
+    Variante float32 del nucleo fusionado: escribe la mitad de bytes por frame
+    y usa el seno polinomial _sin_aprox, cuyo error (~3e-7) queda por debajo
+    de la resolucion de float32 sobre voltajes de cientos de volts. La
+    variante float64 conserva el sin de libm para no degradar la precision
+    que ese dtype promete.
+    """
+    omega_vertical = DOS_PI * frecuencia_vertical
+    omega_horizontal = DOS_PI * frecuencia_horizontal
+    for i in prange(tiempos.shape[0]):
+        t = i / fps
+        tiempos[i] = t
+        senal_vertical = amplitud_vertical * _sin_aprox(omega_vertical * t + fase_vertical)
+        senal_horizontal = amplitud_horizontal * _sin_aprox(omega_horizontal * t + fase_horizontal)
+        voltajes_verticales[i] = max(_VOLTAJE_V_MIN, min(_VOLTAJE_V_MAX, senal_vertical))
+        voltajes_horizontales[i] = max(_VOLTAJE_H_MIN, min(_VOLTAJE_H_MAX, senal_horizontal))
+
+def generar_secuencia_lissajous_vectorizada(config_lissajous, duracion_segundos, fps=30,
+                                            dtype=np.float32):
+    """
+    Genera la secuencia temporal de voltajes de una Figura de Lissajous con NumPy.
+    En lugar de llamar generar_voltajes_lissajous una vez por frame (un sin
+    escalar y varios diccionarios por llamada), evalua las dos señales completas
+    con llamadas vectorizadas a np.sin y recorta con np.clip.
+    Devuelve arreglos por campo (estructura de arreglos) en vez de lista de dicts.
+    El default es float32: los voltajes van de -300 a 300 V con 0.1 V de
+    resolucion util y float32 da 7 cifras decimales, de sobra; a cambio se
+    reduce a la mitad el trafico de memoria y caben el doble de elementos por
+    registro SIMD. Pasar dtype=np.float64 si algun consumidor necesita mas.
+    OJO: los arreglos devueltos son buffers reutilizados por hilo, validos hasta
+    la siguiente llamada en el mismo hilo; copiarlos si hay que conservarlos.
+    """
+    _validar_configuracion_lissajous(config_lissajous)
+
+    num_frames = int(duracion_segundos * fps)
+    buffers = _obtener_buffers_secuencia(num_frames, np.dtype(dtype))
+
+    tiempos = buffers['tiempo']
+
+    # Si la figura es periodica y el periodo cae en un numero entero de frames
+    # menor que la secuencia, basta evaluar sin sobre un solo periodo y repetir
+    # ese bloque: una animacion de 10 s con T = 1 s hace 10 veces menos trabajo
+    # trigonometrico y el resto son copias de memoria
+    periodo = calcular_periodo_lissajous(config_lissajous['frecuencia_vertical'],
+                                         config_lissajous['frecuencia_horizontal'])
+    frames_periodo = periodo * fps
+    frames_periodo_entero = int(round(frames_periodo))
+    if (abs(frames_periodo - frames_periodo_entero) < 1e-6 and
+            0 < frames_periodo_entero < num_frames):
+        omega_vertical = DOS_PI * config_lissajous['frecuencia_vertical']
+        omega_horizontal = DOS_PI * config_lissajous['frecuencia_horizontal']
+
+        # Un periodo evaluado en float64 (la precision del bloque se replica a
+        # toda la secuencia) y recortado a los limites de voltaje
+        tiempos_periodo = np.arange(frames_periodo_entero, dtype=np.float64) / fps
+        periodo_vertical = np.clip(
+            config_lissajous['amplitud_vertical'] *
+            np.sin(omega_vertical * tiempos_periodo + config_lissajous['fase_vertical']),
+            _VOLTAJE_V_MIN, _VOLTAJE_V_MAX).astype(tiempos.dtype)
+        periodo_horizontal = np.clip(
+            config_lissajous['amplitud_horizontal'] *
+            np.sin(omega_horizontal * tiempos_periodo + config_lissajous['fase_horizontal']),
+            _VOLTAJE_H_MIN, _VOLTAJE_H_MAX).astype(tiempos.dtype)
+
+        np.divide(buffers['indices'], fps, out=tiempos)
+        voltajes_verticales = buffers['voltaje_vertical']
+        voltajes_horizontales = buffers['voltaje_horizontal']
+        for inicio in range(0, num_frames, frames_periodo_entero):
+            fin = min(inicio + frames_periodo_entero, num_frames)
+            voltajes_verticales[inicio:fin] = periodo_vertical[:fin - inicio]
+            voltajes_horizontales[inicio:fin] = periodo_horizontal[:fin - inicio]
+
+        return {
+            'tiempo': tiempos,
+            'voltaje_vertical': voltajes_verticales,
+            'voltaje_horizontal': voltajes_horizontales,
+            'num_frames': num_frames,
+            'fps': fps
+        }
+
+    if NUMBA_DISPONIBLE and tiempos.dtype in (np.float32, np.float64):
+        # Nucleo fusionado: una sola pasada paralela sobre los tres buffers
+        # (sin de libm para float64, seno polinomial para float32)
+        nucleo = (_llenar_secuencia_nucleo if tiempos.dtype == np.float64
+                  else _llenar_secuencia_nucleo_f32)
+        nucleo(
+            tiempos, buffers['voltaje_vertical'], buffers['voltaje_horizontal'], float(fps),
+            float(config_lissajous['frecuencia_vertical']),
+            float(config_lissajous['fase_vertical']),
+            float(config_lissajous['amplitud_vertical']),
+            float(config_lissajous['frecuencia_horizontal']),
+            float(config_lissajous['fase_horizontal']),
+            float(config_lissajous['amplitud_horizontal']))
+
+        return {
+            'tiempo': tiempos,
+            'voltaje_vertical': buffers['voltaje_vertical'],
+            'voltaje_horizontal': buffers['voltaje_horizontal'],
+            'num_frames': num_frames,
+            'fps': fps
+        }
+
+    np.divide(buffers['indices'], fps, out=tiempos)
+
+    # Frecuencia angular precalculada una sola vez por eje
+    omega_vertical = DOS_PI * config_lissajous['frecuencia_vertical']
+    omega_horizontal = DOS_PI * config_lissajous['frecuencia_horizontal']
+
+    fases = buffers['fase']
+    voltajes_verticales = buffers['voltaje_vertical']
+    voltajes_horizontales = buffers['voltaje_horizontal']
+
+    if config_lissajous['frecuencia_vertical'] == config_lissajous['frecuencia_horizontal']:
+        # Frecuencias iguales (circulo, elipse, linea diagonal): las dos señales
+        # comparten el argumento omega*t, asi que en vez de dos pasadas de np.sin
+        # se evaluan seno y coseno del mismo angulo y la señal horizontal se
+        # reconstruye con la identidad sin(theta + delta) = sin*cos(delta) + cos*sin(delta)
+        np.multiply(tiempos, omega_vertical, out=fases)
+        np.add(fases, config_lissajous['fase_vertical'], out=fases)
+        np.sin(fases, out=voltajes_verticales)       # senos
+        np.cos(fases, out=voltajes_horizontales)     # cosenos
+
+        delta_fase = config_lissajous['fase_horizontal'] - config_lissajous['fase_vertical']
+        # horizontal = A_h * (sen*cos(delta) + cos*sen(delta)), usando 'fases'
+        # como scratch para no asignar temporales
+        np.multiply(voltajes_verticales, math.cos(delta_fase), out=fases)
+        voltajes_horizontales *= math.sin(delta_fase)
+        voltajes_horizontales += fases
+        voltajes_horizontales *= config_lissajous['amplitud_horizontal']
+        voltajes_verticales *= config_lissajous['amplitud_vertical']
+    else:
+        np.multiply(tiempos, omega_vertical, out=fases)
+        np.add(fases, config_lissajous['fase_vertical'], out=fases)
+        np.sin(fases, out=voltajes_verticales)
+        voltajes_verticales *= config_lissajous['amplitud_vertical']
+
+        np.multiply(tiempos, omega_horizontal, out=fases)
+        np.add(fases, config_lissajous['fase_horizontal'], out=fases)
+        np.sin(fases, out=voltajes_horizontales)
+        voltajes_horizontales *= config_lissajous['amplitud_horizontal']
+
+    np.clip(voltajes_verticales,
+            crt_parameters.VOLTAJE_VERTICAL_MIN, crt_parameters.VOLTAJE_VERTICAL_MAX,
+            out=voltajes_verticales)
+    np.clip(voltajes_horizontales,
+            crt_parameters.VOLTAJE_HORIZONTAL_MIN, crt_parameters.VOLTAJE_HORIZONTAL_MAX,
+            out=voltajes_horizontales)
+
+    return {
+        'tiempo': tiempos,
+        'voltaje_vertical': voltajes_verticales,
+        'voltaje_horizontal': voltajes_horizontales,
+        'num_frames': num_frames,
+        'fps': fps
+    }
+
+# Tipo estructurado de un frame de la secuencia: estructura de arreglos contigua
+# en lugar de un diccionario Python por frame. Campos en float32: los voltajes
+# estan acotados a +-300 V y el tiempo de una animacion a unos cuantos minutos,
+# asi que 7 cifras decimales alcanzan y cada frame pesa la mitad
+_DTYPE_SECUENCIA = np.dtype([
+    ('voltaje_vertical', 'f4'),
+    ('voltaje_horizontal', 'f4'),
+    ('tiempo', 'f4'),
+    ('frame', 'i4')
+])
+
+class SecuenciaLissajous:
+    """
+    Envoltura ligera sobre el arreglo estructurado de la secuencia.
+    Indexar con un nombre de campo ('voltaje_vertical', ...) devuelve la
+    columna completa como ndarray; indexar con un entero sintetiza bajo
+    demanda el diccionario por frame del formato antiguo, asi que los
+    consumidores legados siguen funcionando sin materializar N dicts.
+    Un slice devuelve la lista de diccionarios de ese tramo, como lo hacia
+    la lista original.
+    """
+    __slots__ = ('datos',)
+
+    def __init__(self, datos):
+        self.datos = datos
+
+    def __len__(self):
+        return len(self.datos)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, str):
+            return self.datos[indice]
+        campos = self.datos.dtype.names
+        if isinstance(indice, slice):
+            return [dict(zip(campos, fila)) for fila in self.datos[indice].tolist()]
+        fila = self.datos[indice]
+        return dict(zip(campos, fila.tolist()))
+
+    def __iter__(self):
+        campos = self.datos.dtype.names
+        for fila in self.datos.tolist():
+            yield dict(zip(campos, fila))
+
 def generar_secuencia_lissajous(config_lissajous, duracion_segundos, fps=30):
     """
     Genera una secuencia temporal de voltajes para animar una Figura de Lissajous.
     duracion_segundos: cuanto tiempo dura la animacion
     fps: frames per second para la animacion
+    Devuelve una SecuenciaLissajous sobre un arreglo estructurado preasignado
+    (columnas voltaje_vertical, voltaje_horizontal, tiempo, frame) en vez de una
+    lista de diccionarios: miles de frames caben en un solo bloque contiguo sin
+    presion sobre el recolector, y el formato dict por frame se sintetiza solo
+    si alguien indexa frames sueltos.
     """
-    num_frames = int(duracion_segundos * fps)
-    secuencia = []
-    
-    for frame in range(num_frames):
-        tiempo_actual = frame / fps
-        
-        voltajes = generar_voltajes_lissajous(tiempo_actual, config_lissajous)
-        
-        # Agregar informacion del frame para la animacion
-        voltajes['frame'] = frame
-        voltajes['tiempo_total'] = duracion_segundos
-        voltajes['fps'] = fps
-        
-        secuencia.append(voltajes)
-    
-    return secuencia
+    vectorizada = generar_secuencia_lissajous_vectorizada(config_lissajous, duracion_segundos, fps)
+    num_frames = vectorizada['num_frames']
+
+    secuencia = np.empty(num_frames, dtype=_DTYPE_SECUENCIA)
+    secuencia['voltaje_vertical'] = vectorizada['voltaje_vertical']
+    secuencia['voltaje_horizontal'] = vectorizada['voltaje_horizontal']
+    secuencia['tiempo'] = vectorizada['tiempo']
+    secuencia['frame'] = np.arange(num_frames, dtype=np.int32)
 
+    return SecuenciaLissajous(secuencia)
+
+def secuencia_a_lista(secuencia):
+    """
+    Convierte una secuencia estructurada al formato lista-de-diccionarios para
+    la frontera JSON con el frontend (solo cuando de verdad hace falta).
+    tolist() convierte todo el arreglo a escalares nativos en una sola llamada
+    C, en vez de indexar campo por campo fila por fila desde Python.
+    Acepta tanto el arreglo estructurado crudo como una SecuenciaLissajous.
+    """
+    if isinstance(secuencia, SecuenciaLissajous):
+        secuencia = secuencia.datos
+    campos = secuencia.dtype.names
+    return [dict(zip(campos, fila)) for fila in secuencia.tolist()]
+
+@functools.lru_cache(maxsize=64)
 def calcular_periodo_lissajous(frecuencia_vertical, frecuencia_horizontal):
     """
     Calcula el periodo de repeticion de una Figura de Lissajous.
-    El periodo es el minimo comun multiplo de los periodos individuales.
+    El periodo es el minimo comun multiplo de los periodos individuales:
+    con frecuencias racionales fv = a/b y fh = c/d (reducidas), el MCM de
+    b/a y d/c es mcm(b, d) / mcd(a, c). Antes se aproximaba con
+    max(T1, T2) * 10, que generaba hasta 10 veces mas frames de los
+    necesarios (una figura 3:2 se repite en 1 s, no en 5 s).
+    El resultado queda memoizado: la aritmetica con Fraction no es gratis y
+    las mismas parejas de frecuencias (los presets) se consultan una y otra vez.
     """
-    # Periodos individuales
-    periodo_vertical = 1.0 / frecuencia_vertical
-    periodo_horizontal = 1.0 / frecuencia_horizontal
-    
-    # Para simplificar, usamos el maximo de los dos periodos multiplicado por un factor
-    # En la practica, el calculo del MCM requiere trabajar con fracciones
-    periodo_lissajous = max(periodo_vertical, periodo_horizontal) * 10
-    
-    return periodo_lissajous
+    fraccion_vertical = fractions.Fraction(frecuencia_vertical).limit_denominator(1000)
+    fraccion_horizontal = fractions.Fraction(frecuencia_horizontal).limit_denominator(1000)
+
+    # Periodos Tv = b/a y Th = d/c; su MCM exacto como fraccion
+    numerador = math.lcm(fraccion_vertical.denominator, fraccion_horizontal.denominator)
+    denominador = math.gcd(fraccion_vertical.numerator, fraccion_horizontal.numerator)
+
+    return numerador / denominador
+
+#-------------------------------------------------------------------------------------
+# EVALUADOR ESPECIALIZADO POR CONFIGURACION (GENERACION DE CODIGO EN CALIENTE)
+#-------------------------------------------------------------------------------------
+def construir_evaluador_lissajous(voltaje_aceleracion, config_lissajous):
+    """
+    Genera una funcion especializada evaluador(t) -> (posicion_x, posicion_y)
+    para un voltaje de aceleracion y una configuracion de Lissajous fijos.
+    Todos los invariantes (coeficientes de deflexion, amplitudes, frecuencias
+    angulares y fases) se hornean como literales en el codigo fuente de la
+    funcion, asi que cada frame cuesta dos sin y dos multiplicaciones, sin
+    buscar nada en diccionarios. Si Numba esta disponible, la funcion generada
+    ademas se compila (sin cache: el fuente cambia con cada configuracion).
+    Reconstruir solo cuando el usuario cambia un parametro.
+    Asume amplitudes dentro de los limites de placa (las valida), de modo que
+    el recorte de voltaje nunca actua y la posicion es lineal en la señal.
+    """
+    # Import local: los coeficientes viven en electron_motion y este modulo
+    # no depende de el en ningun otro punto
+    import electron_motion
+
+    _validar_configuracion_lissajous(config_lissajous)
+
+    coef_x, coef_y = electron_motion.calcular_coeficientes_deflexion(voltaje_aceleracion)
+
+    ganancia_x = coef_x * config_lissajous['amplitud_horizontal']
+    ganancia_y = coef_y * config_lissajous['amplitud_vertical']
+    omega_vertical = DOS_PI * config_lissajous['frecuencia_vertical']
+    omega_horizontal = DOS_PI * config_lissajous['frecuencia_horizontal']
+
+    codigo = (
+        "def _evaluador(t):\n"
+        f"    return ({ganancia_x!r} * math.sin({omega_horizontal!r} * t + {config_lissajous['fase_horizontal']!r}),\n"
+        f"            {ganancia_y!r} * math.sin({omega_vertical!r} * t + {config_lissajous['fase_vertical']!r}))\n"
+    )
+    espacio = {'math': math}
+    exec(codigo, espacio)
+    evaluador = espacio['_evaluador']
+
+    if electron_motion.NUMBA_DISPONIBLE:
+        from numba import njit
+        evaluador = njit(evaluador)
+
+    return evaluador
 
 #-------------------------------------------------------------------------------------
 # FUNCIONES DE CONTROL EN TIEMPO REAL
 #-------------------------------------------------------------------------------------
+# Tabla parametro -> validador: reemplaza los seis if casi identicos y permite
+# iterar solo sobre las claves que el usuario realmente cambio (tipicamente una
+# por movimiento de slider)
+_VALIDADORES_PARAMETROS = {
+    'frecuencia_vertical': validar_frecuencia,
+    'fase_vertical': validar_fase,
+    'amplitud_vertical': validar_amplitud_vertical,
+    'frecuencia_horizontal': validar_frecuencia,
+    'fase_horizontal': validar_fase,
+    'amplitud_horizontal': validar_amplitud_horizontal
+}
+
+def actualizar_parametros_lissajous_inplace(config_actual, nuevos_parametros):
+    """
+    Escribe los parametros validados directamente en config_actual y lo
+    devuelve. Para llamadores dueños de su configuracion (como el estado por
+    sesion de app.py) evita copiar el diccionario completo en cada movimiento
+    de slider. Los parametros desconocidos o fuera de rango se ignoran.
+    """
+    for parametro, valor in nuevos_parametros.items():
+        validador = _VALIDADORES_PARAMETROS.get(parametro)
+        if validador is not None and validador(valor):
+            config_actual[parametro] = valor
+
+    # Si la configuracion mantiene las omegas cacheadas, refrescarlas por si
+    # cambio alguna frecuencia
+    if 'omega_vertical' in config_actual:
+        asegurar_omegas(config_actual)
+
+    return config_actual
+
 def actualizar_parametros_lissajous(config_actual, nuevos_parametros):
     """
     Actualiza los parametros de Lissajous de manera segura, validando cada valor.
+    Los parametros desconocidos o con valores fuera de rango se ignoran.
+    Devuelve una configuracion nueva sin tocar la recibida; si no hay nada que
+    cambiar, devuelve la misma referencia sin copiar.
     """
-    config_actualizada = config_actual.copy()
-    
-    # Validar y actualizar frecuencia vertical
-    if 'frecuencia_vertical' in nuevos_parametros:
-        if validar_frecuencia(nuevos_parametros['frecuencia_vertical']):
-            config_actualizada['frecuencia_vertical'] = nuevos_parametros['frecuencia_vertical']
-    
-    # Validar y actualizar fase vertical
-    if 'fase_vertical' in nuevos_parametros:
-        if validar_fase(nuevos_parametros['fase_vertical']):
-            config_actualizada['fase_vertical'] = nuevos_parametros['fase_vertical']
-    
-    # Validar y actualizar amplitud vertical
-    if 'amplitud_vertical' in nuevos_parametros:
-        if validar_amplitud_vertical(nuevos_parametros['amplitud_vertical']):
-            config_actualizada['amplitud_vertical'] = nuevos_parametros['amplitud_vertical']
-    
-    # Validar y actualizar frecuencia horizontal
-    if 'frecuencia_horizontal' in nuevos_parametros:
-        if validar_frecuencia(nuevos_parametros['frecuencia_horizontal']):
-            config_actualizada['frecuencia_horizontal'] = nuevos_parametros['frecuencia_horizontal']
-    
-    # Validar y actualizar fase horizontal
-    if 'fase_horizontal' in nuevos_parametros:
-        if validar_fase(nuevos_parametros['fase_horizontal']):
-            config_actualizada['fase_horizontal'] = nuevos_parametros['fase_horizontal']
-    
-    # Validar y actualizar amplitud horizontal
-    if 'amplitud_horizontal' in nuevos_parametros:
-        if validar_amplitud_horizontal(nuevos_parametros['amplitud_horizontal']):
-            config_actualizada['amplitud_horizontal'] = nuevos_parametros['amplitud_horizontal']
-    
-    return config_actualizada
+    if not nuevos_parametros:
+        return config_actual
+
+    return actualizar_parametros_lissajous_inplace(config_actual.copy(), nuevos_parametros)
+
+# Plantilla construida una sola vez; cada llamada devuelve una copia porque
+# los llamadores (p. ej. el estado por sesion en app.py) la mutan
+_CONFIG_DEFAULT_LISSAJOUS = {
+    'frecuencia_vertical': FRECUENCIA_DEFAULT,
+    'fase_vertical': FASE_DEFAULT,
+    'amplitud_vertical': AMPLITUD_VERTICAL_DEFAULT,
+    'frecuencia_horizontal': FRECUENCIA_DEFAULT,
+    'fase_horizontal': FASE_DEFAULT,
+    'amplitud_horizontal': AMPLITUD_HORIZONTAL_DEFAULT
+}
 
 def obtener_configuracion_default_lissajous():
     """
     Devuelve una configuracion por defecto para las Figuras de Lissajous.
     """
-    return {
-        'frecuencia_vertical': FRECUENCIA_DEFAULT,
-        'fase_vertical': FASE_DEFAULT,
-        'amplitud_vertical': AMPLITUD_VERTICAL_DEFAULT,
-        'frecuencia_horizontal': FRECUENCIA_DEFAULT,
-        'fase_horizontal': FASE_DEFAULT,
-        'amplitud_horizontal': AMPLITUD_HORIZONTAL_DEFAULT
-    }
+    return dict(_CONFIG_DEFAULT_LISSAJOUS)
 
 #-------------------------------------------------------------------------------------
 # FUNCIONES AUXILIARES PARA EL FRONTEND
 #-------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def obtener_info_lissajous():
     """
     Devuelve informacion completa sobre los parametros de Lissajous para el frontend.
+    Memoizada: el contenido depende solo de constantes de modulo y el frontend
+    la consulta en cada render.
     """
     return {
         'rangos': {
@@ -400,28 +877,40 @@ def obtener_info_lissajous():
             },
             'amplitud_vertical': {
                 'min': 0,
-                'max': min(abs(crt_parameters.VOLTAJE_VERTICAL_MIN), abs(crt_parameters.VOLTAJE_VERTICAL_MAX)),
+                'max': _AMP_MAX_V,
                 'default': AMPLITUD_VERTICAL_DEFAULT,
                 'unidad': 'V'
             },
             'amplitud_horizontal': {
                 'min': 0,
-                'max': min(abs(crt_parameters.VOLTAJE_HORIZONTAL_MIN), abs(crt_parameters.VOLTAJE_HORIZONTAL_MAX)),
+                'max': _AMP_MAX_H,
                 'default': AMPLITUD_HORIZONTAL_DEFAULT,
                 'unidad': 'V'
             }
         },
-        'presets': obtener_presets_lissajous(),
+        # Copia plana del proxy de presets: orjson no serializa mappingproxy
+        'presets': dict(obtener_presets_lissajous()),
         'configuracion_default': obtener_configuracion_default_lissajous()
     }
 
+# Factores de conversion precalculados: una multiplicacion por llamada en vez
+# de recomputar la division con math.pi cada vez
+_DEG2RAD = math.pi / 180
+_RAD2DEG = 180 / math.pi
+
 def convertir_grados_a_radianes(grados):
-    """Convierte grados a radianes para uso interno."""
-    return grados * math.pi / 180
+    """Convierte grados a radianes para uso interno.
+    Acepta escalares o ndarrays (los arreglos van por np.deg2rad vectorizado)."""
+    if isinstance(grados, np.ndarray):
+        return np.deg2rad(grados)
+    return grados * _DEG2RAD
 
 def convertir_radianes_a_grados(radianes):
-    """Convierte radianes a grados para mostrar al usuario."""
-    return radianes * 180 / math.pi
+    """Convierte radianes a grados para mostrar al usuario.
+    Acepta escalares o ndarrays (los arreglos van por np.rad2deg vectorizado)."""
+    if isinstance(radianes, np.ndarray):
+        return np.rad2deg(radianes)
+    return radianes * _RAD2DEG
 
 #-------------------------------------------------------------------------------------
 # FUNCIÓN PARA OBTENER PRESET ESPECÍFICO POR RATIO
@@ -445,7 +934,7 @@ def obtener_preset_por_ratio(ratio_vertical, ratio_horizontal, fase_desfase=0):
         'fase_horizontal': fase_desfase,  # Aplicar desfase al horizontal
         'amplitud_horizontal': 150,
         'ratio_string': f"{ratio_vertical}:{ratio_horizontal}",
-        'fase_grados': fase_desfase * 180 / math.pi
+        'fase_grados': fase_desfase * _RAD2DEG
     }
     
     return config
@@ -463,19 +952,48 @@ def debug_preset_lissajous(nombre_preset):
         return {'error': f'Preset no encontrado: {nombre_preset}'}
     
     preset = presets[nombre_preset]
-    
-    # Generar algunos puntos de muestra
-    puntos_muestra = []
-    for t in [0, 0.25, 0.5, 0.75, 1.0]:
-        voltajes = generar_voltajes_lissajous(t, preset)
-        puntos_muestra.append({
+
+    # Generar algunos puntos de muestra: las dos señales completas con un solo
+    # np.sin vectorizado por eje en vez de cinco pasadas escalares por el
+    # camino de validacion y armado de diccionarios
+    tiempos = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+    voltajes_verticales = preset['amplitud_vertical'] * np.sin(
+        DOS_PI * preset['frecuencia_vertical'] * tiempos + preset['fase_vertical'])
+    voltajes_horizontales = preset['amplitud_horizontal'] * np.sin(
+        DOS_PI * preset['frecuencia_horizontal'] * tiempos + preset['fase_horizontal'])
+    np.clip(voltajes_verticales, _VOLTAJE_V_MIN, _VOLTAJE_V_MAX, out=voltajes_verticales)
+    np.clip(voltajes_horizontales, _VOLTAJE_H_MIN, _VOLTAJE_H_MAX, out=voltajes_horizontales)
+
+    puntos_muestra = [
+        {
             'tiempo': t,
-            'voltajes': voltajes
-        })
-    
+            'voltajes': {
+                'voltaje_vertical': vv,
+                'voltaje_horizontal': vh,
+                'tiempo': t,
+                'debug_info': {
+                    'config_usado': preset,
+                    'tiempo_original': t,
+                    'tiempo_normalizado': t
+                }
+            }
+        }
+        for t, vv, vh in zip(tiempos.tolist(), voltajes_verticales.tolist(),
+                             voltajes_horizontales.tolist())
+    ]
+
+
     return {
         'preset': preset,
         'puntos_muestra': puntos_muestra,
-        'fase_vertical_grados': preset['fase_vertical'] * 180 / math.pi,
-        'fase_horizontal_grados': preset['fase_horizontal'] * 180 / math.pi
-    }
\ No newline at end of file
+        'fase_vertical_grados': preset['fase_vertical'] * _RAD2DEG,
+        'fase_horizontal_grados': preset['fase_horizontal'] * _RAD2DEG
+    }
+#-------------------------------------------------------------------------------------
+# CALENTAMIENTO DE LOS NUCLEOS COMPILADOS
+#-------------------------------------------------------------------------------------
+# Una llamada de prueba al importar: con la firma explicita la compilacion ya
+# ocurre en el import, y esta invocacion garantiza que el binario cacheado en
+# disco se cargue aqui y no en la primera peticion del servidor.
+_senal_nucleo(0.0, DOS_PI * FRECUENCIA_DEFAULT, FASE_DEFAULT, float(AMPLITUD_VERTICAL_DEFAULT),
+              _VOLTAJE_V_MIN, _VOLTAJE_V_MAX)
@@ -0,0 +1,13 @@
+#-------------------------------------------------------------------------------------
+# PUNTO DE ENTRADA WSGI PARA SERVIDORES DE PRODUCCION
+# El servidor de desarrollo de Werkzeug (app.run) atiende las peticiones en serie,
+# asi que el endpoint de Lissajous en tiempo real bloquea al resto de las APIs.
+# Para produccion se lanza la aplicacion bajo gunicorn con workers asincronos:
+#
+#   gunicorn -k gevent -w 4 --worker-connections 200 wsgi:app
+#-------------------------------------------------------------------------------------
+
+from app import app
+
+if __name__ == '__main__':
+    app.run()